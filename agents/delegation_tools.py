@@ -3,12 +3,14 @@
 import logging
 from typing import Any, Dict, List
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from google.adk.runners import Runner
 from google.adk.sessions import InMemorySessionService
 from google.genai import types
 from pydantic import BaseModel, Field
 
+from tools.declarations import DeclarationCacheMixin
+
 logger = logging.getLogger(__name__)
 
 
@@ -22,7 +24,7 @@ def _load_sub_agent(agent_attr: str):
 class DelegationInput(BaseModel):
     query: str = Field(..., description="The query or instructions for the sub-agent.")
 
-class BaseDelegationTool(BaseTool):
+class BaseDelegationTool(DeclarationCacheMixin, BaseTool):
     """Base class for delegation tools."""
     
     def __init__(self, name: str, description: str, agent_loader):
@@ -35,14 +37,6 @@ class BaseDelegationTool(BaseTool):
     def args_schema(self) -> type[DelegationInput]:
         return DelegationInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     def _get_target_agent(self):
         if self.target_agent is None:
             self.target_agent = self._agent_loader()
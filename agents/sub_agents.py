@@ -25,7 +25,8 @@ Rules:
    b. Iterate through the results and call `get_video_details` for EACH video ID to get the stats.
    c. Compile and present the final answer with all requested data.
 8. **QUOTA AWARENESS**:
-   - `get_latest_videos` and `search_channel_videos` cost **100 quota units**. Use them only when necessary.
+   - `search_channel_videos` costs **100 quota units**. Use it only when necessary.
+   - `get_latest_videos` reads the uploads playlist and costs about **2 quota units**.
    - `get_video_details` and `get_channel_details` cost **1 quota unit**.
    - PREFER `refresh_channel_metadata` (cheap) over search tools when checking for updates on a known channel.
 """
@@ -49,6 +50,7 @@ Responsibilities:
    - **ID IS SUFFICIENT**: You can call `analyze_video` with JUST the `video_id`. The tool will handle URL construction and duration fetching.
    - **No Questions**: Do not ask the user for URL or duration.
 2. Summarize comments using `get_video_comments` and `summarize_text`.
+   - When you also need the video's metadata or stats, call `get_video_bundle` once instead of `get_video_details` plus `get_video_comments`.
 3. Perform sentiment analysis using `get_sentiment`.
 4. SAVE your findings! If a `file_search_store_name` is provided, ensure you use tools that support saving (like `analyze_video` or `submit_batch_job`).
 
@@ -11,6 +11,7 @@ from tools.transcript_tool import AnalyzeVideoTool
 from tools.batch_tool import SubmitBatchJobTool, GetBatchResultsTool
 from tools.youtube import (
     GetLatestVideosTool,
+    GetVideoBundleTool,
     GetVideoCommentsTool,
     GetVideoDetailsTool,
     GetChannelDetailsTool,
@@ -41,6 +42,7 @@ DISCOVERY_TOOLS = [
 ANALYST_TOOLS = [
     AnalyzeVideoTool(),
     GetVideoCommentsTool(),
+    GetVideoBundleTool(),
     FileAnalysisTool(),
     UploadTranscriptToGeminiFileTool(),
     UploadFileSearchDocumentTool(), # Analyst needs to save results
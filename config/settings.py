@@ -50,8 +50,74 @@ CHANNEL_REGISTRY_PATH = str((BASE_DIR / "data" / "channel_registry.json").resolv
 CHANNEL_METADATA_TTL_HOURS = float(os.getenv("CHANNEL_METADATA_TTL_HOURS", "6"))
 
 # --- Tool Defaults ---
+# Worker threads shared by all tools for their blocking API calls
+# (YOUTUBE_TOOL_MAX_WORKERS is still honoured as the previous name).
+TOOL_MAX_WORKERS = int(
+    os.getenv("TOOL_MAX_WORKERS", os.getenv("YOUTUBE_TOOL_MAX_WORKERS", "16"))
+)
+# Separate, smaller pool for fire-and-forget work (File Search ingestion) so slow
+# uploads never queue foreground tool calls.
+TOOL_BACKGROUND_MAX_WORKERS = int(os.getenv("TOOL_BACKGROUND_MAX_WORKERS", "4"))
 YOUTUBE_DEFAULT_MAX_RESULTS = int(os.getenv("YOUTUBE_DEFAULT_MAX_RESULTS", "5"))
 YOUTUBE_DEFAULT_COMMENT_MAX_RESULTS = int(os.getenv("YOUTUBE_DEFAULT_COMMENT_MAX_RESULTS", "100"))
+# Upper bound for paginated comment fetches (100 comments per page, 1 quota unit each).
+YOUTUBE_MAX_COMMENT_RESULTS = int(os.getenv("YOUTUBE_MAX_COMMENT_RESULTS", "500"))
+# Ingest fetched comments into File Search in the background instead of before returning.
+YOUTUBE_COMMENT_INGEST_BACKGROUND = os.getenv(
+    "YOUTUBE_COMMENT_INGEST_BACKGROUND", "true"
+).lower() not in {"0", "false", "no"}
+
+# --- YouTube HTTP transport ---
+YOUTUBE_HTTP2_ENABLED = os.getenv("YOUTUBE_HTTP2_ENABLED", "true").lower() not in {"0", "false", "no"}
+YOUTUBE_HTTP_TIMEOUT_SECONDS = float(os.getenv("YOUTUBE_HTTP_TIMEOUT_SECONDS", "30"))
+YOUTUBE_HTTP_MAX_CONNECTIONS = int(os.getenv("YOUTUBE_HTTP_MAX_CONNECTIONS", "20"))
+YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS = int(
+    os.getenv("YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS", "10")
+)
+YOUTUBE_HTTP_KEEPALIVE_EXPIRY_SECONDS = float(
+    os.getenv("YOUTUBE_HTTP_KEEPALIVE_EXPIRY_SECONDS", "60")
+)
+# Build the shared API client in a background thread at import so the first tool call is warm.
+YOUTUBE_PREWARM_SERVICE = os.getenv("YOUTUBE_PREWARM_SERVICE", "true").lower() not in {
+    "0",
+    "false",
+    "no",
+}
+
+# --- YouTube quota budget ---
+# Units per day shared by all tools in the process; 0 disables local budgeting.
+YOUTUBE_DAILY_QUOTA_UNITS = int(os.getenv("YOUTUBE_DAILY_QUOTA_UNITS", "10000"))
+# Requests per second sent to the API (bursts up to the same number); 0 disables pacing.
+YOUTUBE_MAX_REQUESTS_PER_SECOND = float(os.getenv("YOUTUBE_MAX_REQUESTS_PER_SECOND", "10"))
+
+# --- YouTube circuit breaker ---
+# Consecutive 5xx/network failures before tool calls fail fast; 0 disables the breaker.
+YOUTUBE_CIRCUIT_FAIL_MAX = int(os.getenv("YOUTUBE_CIRCUIT_FAIL_MAX", "5"))
+YOUTUBE_CIRCUIT_RESET_SECONDS = float(os.getenv("YOUTUBE_CIRCUIT_RESET_SECONDS", "30"))
+
+# --- YouTube request batching ---
+# How long the first detail lookup waits for concurrent lookups to share its request.
+YOUTUBE_BATCH_WINDOW_SECONDS = float(os.getenv("YOUTUBE_BATCH_WINDOW_SECONDS", "0.01"))
+
+# --- YouTube response caching ---
+YOUTUBE_CACHE_MAX_ENTRIES = int(os.getenv("YOUTUBE_CACHE_MAX_ENTRIES", "512"))
+YOUTUBE_PLAYLIST_CACHE_TTL_SECONDS = float(os.getenv("YOUTUBE_PLAYLIST_CACHE_TTL_SECONDS", "60"))
+YOUTUBE_SEARCH_CACHE_TTL_SECONDS = float(os.getenv("YOUTUBE_SEARCH_CACHE_TTL_SECONDS", "1800"))
+YOUTUBE_VIDEO_DETAILS_CACHE_TTL_SECONDS = float(
+    os.getenv("YOUTUBE_VIDEO_DETAILS_CACHE_TTL_SECONDS", "1800")
+)
+YOUTUBE_CHANNEL_DETAILS_CACHE_TTL_SECONDS = float(
+    os.getenv("YOUTUBE_CHANNEL_DETAILS_CACHE_TTL_SECONDS", "3600")
+)
+YOUTUBE_COMMENTS_CACHE_TTL_SECONDS = float(os.getenv("YOUTUBE_COMMENTS_CACHE_TTL_SECONDS", "300"))
+# SQLite file that lets video/channel details survive restarts; set to "" to keep caches in memory.
+YOUTUBE_CACHE_DB_PATH = os.getenv(
+    "YOUTUBE_CACHE_DB_PATH", str((BASE_DIR / "data" / "youtube_cache.sqlite3").resolve())
+)
+# Expired rows are kept this long so they can still be revalidated by ETag after a restart.
+YOUTUBE_CACHE_DB_RETENTION_SECONDS = float(
+    os.getenv("YOUTUBE_CACHE_DB_RETENTION_SECONDS", str(7 * 24 * 3600))
+)
 
 # Streamlit / ADK integration
 ADK_SERVER_HOST = os.getenv("ADK_SERVER_HOST", "http://localhost:8000")
@@ -2,10 +2,9 @@
 
 from __future__ import annotations
 
+import io
 import json
 import logging
-import os
-import tempfile
 import time
 from typing import Dict, List, Optional
 
@@ -14,6 +13,9 @@ from google.genai import types
 
 logger = logging.getLogger(__name__)
 
+# Small uploads finish quickly, so the first status checks come sooner than poll_seconds.
+_OPERATION_POLL_INITIAL_SECONDS = 0.25
+
 
 class FileSearchDisabledError(RuntimeError):
     """Raised when file search is invoked but not configured."""
@@ -66,44 +68,32 @@ class FileSearchService:
         if not content.strip():
             raise ValueError("Cannot ingest empty content into File Search.")
 
-        tmp_path = None
-        try:
-            with tempfile.NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False) as tmp_file:
-                tmp_file.write(content)
-                tmp_path = tmp_file.name
-
-            config = {
-                "display_name": display_name,
-                "mime_type": mime_type,
-            }
-            if metadata:
-                config["custom_metadata"] = [{"key": k, "value": v} for k, v in metadata.items()]
-
-            operation = self._client.file_search_stores.upload_to_file_search_store(
-                file_search_store_name=store_name,
-                file=tmp_path,
-                config=config,
-            )
-            completed_op = self._wait_for_operation(operation)
-            document_name = None
-            if completed_op.response:
-                document_name = completed_op.response.document_name
-            logger.info(
-                "Uploaded document %s to store %s (display=%s)",
-                document_name,
-                store_name,
-                display_name,
-            )
-            return {
-                "store_name": store_name,
-                "document_name": document_name,
-            }
-        finally:
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.remove(tmp_path)
-                except OSError:
-                    logger.warning("Failed to clean up temp file %s", tmp_path)
+        config = {
+            "display_name": display_name,
+            "mime_type": mime_type,
+        }
+        if metadata:
+            config["custom_metadata"] = [{"key": k, "value": v} for k, v in metadata.items()]
+
+        operation = self._client.file_search_stores.upload_to_file_search_store(
+            file_search_store_name=store_name,
+            file=io.BytesIO(content.encode("utf-8")),
+            config=config,
+        )
+        completed_op = self._wait_for_operation(operation)
+        document_name = None
+        if completed_op.response:
+            document_name = completed_op.response.document_name
+        logger.info(
+            "Uploaded document %s to store %s (display=%s)",
+            document_name,
+            store_name,
+            display_name,
+        )
+        return {
+            "store_name": store_name,
+            "document_name": document_name,
+        }
 
     def query(
         self,
@@ -173,15 +163,17 @@ class FileSearchService:
         return chunks
 
     def _wait_for_operation(self, operation):
-        """Poll Gemini operations until the upload completes."""
+        """Poll Gemini operations until the upload completes, backing off up to the poll interval."""
         start = time.time()
         current = operation
+        delay = min(_OPERATION_POLL_INITIAL_SECONDS, self._poll_seconds)
         while not current.done:
             if time.time() - start > self._poll_timeout:
                 raise TimeoutError(
                     f"File Search upload did not complete within {self._poll_timeout} seconds."
                 )
-            time.sleep(self._poll_seconds)
+            time.sleep(delay)
+            delay = min(delay * 2, self._poll_seconds)
             current = self._client.operations.get(current)
 
         if current.error:
@@ -0,0 +1,56 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from pydantic import BaseModel
+
+from tools.declarations import DeclarationCacheMixin
+
+
+class _Args(BaseModel):
+    value: int
+
+
+class _Tool(DeclarationCacheMixin):
+    NAME = "example_tool"
+
+    def __init__(self, variant: str = "gemini") -> None:
+        self._api_variant = variant
+
+    @property
+    def args_schema(self) -> type[_Args]:
+        return _Args
+
+
+class _OtherTool(_Tool):
+    NAME = "other_tool"
+
+
+class DeclarationCacheMixinTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch(
+            "tools.declarations.tool_utils.build_function_declaration",
+            side_effect=lambda func, variant: SimpleNamespace(name=None, variant=variant),
+        )
+        self.build = patcher.start()
+        self.addCleanup(patcher.stop)
+        for cls in (_Tool, _OtherTool):
+            if "_declaration_cache" in cls.__dict__:
+                delattr(cls, "_declaration_cache")
+
+    def test_declaration_is_built_once_per_variant(self) -> None:
+        first = _Tool()._get_declaration()
+        self.assertIs(_Tool()._get_declaration(), first)
+        self.assertEqual(first.name, "example_tool")
+        _Tool(variant="vertex")._get_declaration()
+        self.assertEqual(self.build.call_count, 2)
+
+    def test_subclasses_do_not_share_declarations(self) -> None:
+        self.assertEqual(_Tool()._get_declaration().name, "example_tool")
+        self.assertEqual(_OtherTool()._get_declaration().name, "other_tool")
+
+
+if __name__ == "__main__":
+    unittest.main()
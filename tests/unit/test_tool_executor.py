@@ -0,0 +1,77 @@
+from __future__ import annotations
+
+import asyncio
+import threading
+import unittest
+
+from tools.executor import run_blocking, run_blocking_coalesced, submit_blocking
+
+
+class RunBlockingCoalescedTest(unittest.TestCase):
+    def test_concurrent_identical_calls_share_one_execution(self) -> None:
+        calls = []
+        release = threading.Event()
+
+        def fetch(video_id: str) -> dict:
+            calls.append(video_id)
+            release.wait(timeout=5)
+            return {"video_id": video_id}
+
+        async def scenario():
+            first = asyncio.ensure_future(run_blocking_coalesced(fetch, video_id="a"))
+            second = asyncio.ensure_future(run_blocking_coalesced(fetch, video_id="a"))
+            other = asyncio.ensure_future(run_blocking_coalesced(fetch, video_id="b"))
+            await asyncio.sleep(0.05)
+            release.set()
+            return await asyncio.gather(first, second, other)
+
+        first, second, other = asyncio.run(scenario())
+
+        self.assertEqual(sorted(calls), ["a", "b"])
+        self.assertEqual(first, second)
+        self.assertIsNot(first, second)
+        self.assertEqual(other, {"video_id": "b"})
+
+    def test_sequential_calls_run_again(self) -> None:
+        calls = []
+
+        def fetch(video_id: str) -> str:
+            calls.append(video_id)
+            return video_id
+
+        async def scenario():
+            await run_blocking_coalesced(fetch, video_id="a")
+            await run_blocking_coalesced(fetch, video_id="a")
+
+        asyncio.run(scenario())
+        self.assertEqual(calls, ["a", "a"])
+
+    def test_errors_reach_every_waiter(self) -> None:
+        def fetch(video_id: str) -> str:
+            raise RuntimeError("boom")
+
+        async def scenario():
+            return await asyncio.gather(
+                run_blocking_coalesced(fetch, video_id="a"),
+                run_blocking_coalesced(fetch, video_id="a"),
+                return_exceptions=True,
+            )
+
+        results = asyncio.run(scenario())
+        self.assertTrue(all(isinstance(result, RuntimeError) for result in results))
+
+
+class SubmitBlockingTest(unittest.TestCase):
+    def test_background_work_does_not_use_the_tool_pool(self) -> None:
+        def thread_name() -> str:
+            return threading.current_thread().name
+
+        background = submit_blocking(thread_name).result(timeout=5)
+        foreground = asyncio.run(run_blocking(thread_name))
+
+        self.assertTrue(background.startswith("tool-background"))
+        self.assertFalse(foreground.startswith("tool-background"))
+
+
+if __name__ == "__main__":
+    unittest.main()
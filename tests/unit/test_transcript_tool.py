@@ -0,0 +1,36 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from tools.transcript_tool import AnalyzeVideoTool
+
+
+class UploadTranscriptTextTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tool = AnalyzeVideoTool()
+        self.upload = mock.Mock(return_value=SimpleNamespace(name="files/1"))
+        self.tool._client = SimpleNamespace(files=SimpleNamespace(upload=self.upload))
+        patcher = mock.patch.object(
+            self.tool, "_wait_for_file_active", return_value="https://example.invalid/files/1"
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def _upload_config(self, **kwargs):
+        uri = self.tool._upload_transcript_text(transcript_text="[00:00] Hi", **kwargs)
+        self.assertEqual(uri, "https://example.invalid/files/1")
+        return self.upload.call_args.kwargs["config"]
+
+    def test_display_name_uses_the_video_title(self) -> None:
+        config = self._upload_config(video_id="dQw4w9WgXcQ", video_title="Never Gonna")
+        self.assertEqual(config, {"mime_type": "text/plain", "display_name": "Never Gonna"})
+
+    def test_display_name_falls_back_to_the_video_id(self) -> None:
+        config = self._upload_config(video_id="dQw4w9WgXcQ", video_title=None)
+        self.assertEqual(config["display_name"], "Transcript dQw4w9WgXcQ")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,92 @@
+from __future__ import annotations
+
+import threading
+import time
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+
+from tools.youtube.batching import IdBatcher
+
+
+class IdBatcherTest(unittest.TestCase):
+    def test_concurrent_lookups_share_one_fetch(self) -> None:
+        calls = []
+        lock = threading.Lock()
+
+        def fetch(ids):
+            with lock:
+                calls.append(list(ids))
+            return {item_id: {"id": item_id} for item_id in ids if item_id != "missing"}
+
+        batcher = IdBatcher(fetch, window=0.05)
+        ids = ["a", "b", "c", "a", "missing"]
+        with ThreadPoolExecutor(max_workers=len(ids)) as pool:
+            results = list(pool.map(batcher.get, ids))
+
+        self.assertEqual(results, [{"id": "a"}, {"id": "b"}, {"id": "c"}, {"id": "a"}, None])
+        self.assertEqual(len(calls), 1)
+        self.assertCountEqual(calls[0], ["a", "b", "c", "missing"])
+
+    def test_batches_are_capped_at_max_batch(self) -> None:
+        calls = []
+
+        def fetch(ids):
+            calls.append(len(ids))
+            return {item_id: item_id for item_id in ids}
+
+        batcher = IdBatcher(fetch, window=0.05, max_batch=2)
+        ids = [str(index) for index in range(5)]
+        with ThreadPoolExecutor(max_workers=len(ids)) as pool:
+            self.assertEqual(list(pool.map(batcher.get, ids)), ids)
+        self.assertTrue(all(size <= 2 for size in calls))
+        self.assertEqual(sum(calls), 5)
+
+    def test_leader_returns_after_its_own_fetch(self) -> None:
+        calls = []
+        first_in_flight = threading.Event()
+        release_first = threading.Event()
+        first_returned = threading.Event()
+
+        def fetch(ids):
+            calls.append(list(ids))
+            if len(calls) == 1:
+                first_in_flight.set()
+                release_first.wait(timeout=5)
+            else:
+                first_returned.wait(timeout=5)
+            return {item_id: item_id for item_id in ids}
+
+        batcher = IdBatcher(fetch, window=0)
+
+        def first_lookup():
+            result = batcher.get("a")
+            fetches = len(calls)
+            first_returned.set()
+            return result, fetches
+
+        with ThreadPoolExecutor(max_workers=3) as pool:
+            first = pool.submit(first_lookup)
+            self.assertTrue(first_in_flight.wait(timeout=5))
+            later = [pool.submit(batcher.get, item_id) for item_id in ("b", "c")]
+            while len(batcher._pending) < 2:
+                time.sleep(0.001)
+            release_first.set()
+
+            self.assertEqual(first.result(timeout=1), ("a", 1))
+            self.assertEqual([future.result(timeout=5) for future in later], ["b", "c"])
+        self.assertEqual(calls, [["a"], ["b", "c"]])
+
+    def test_fetch_errors_reach_every_waiter(self) -> None:
+        def fetch(ids):
+            raise RuntimeError("boom")
+
+        batcher = IdBatcher(fetch, window=0)
+        with self.assertRaises(RuntimeError):
+            batcher.get("a")
+        # The batcher recovers for later lookups.
+        with self.assertRaises(RuntimeError):
+            batcher.get("b")
+
+
+if __name__ == "__main__":
+    unittest.main()
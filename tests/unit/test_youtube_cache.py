@@ -0,0 +1,95 @@
+from __future__ import annotations
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from tools.youtube.cache import SQLiteCacheStore, TTLCache
+
+
+class TTLCacheTest(unittest.TestCase):
+    def test_returns_copies_of_cached_values(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=60)
+        payload = [{"id": "abc", "snippet": {"title": "Original"}}]
+        cache.set("key", payload)
+
+        payload[0]["snippet"]["title"] = "Mutated by caller"
+        first = cache.get("key")
+        first[0]["snippet"]["title"] = "Mutated after read"
+
+        self.assertEqual(cache.get("key")[0]["snippet"]["title"], "Original")
+
+    def test_entries_expire_after_ttl(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=10)
+        with mock.patch("tools.youtube.cache.time.monotonic", return_value=100.0):
+            cache.set("key", {"value": 1})
+        with mock.patch("tools.youtube.cache.time.monotonic", return_value=105.0):
+            self.assertEqual(cache.get("key"), {"value": 1})
+        with mock.patch("tools.youtube.cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("key"))
+        self.assertEqual(len(cache), 0)
+
+    def test_evicts_least_recently_used(self) -> None:
+        cache = TTLCache(maxsize=2, ttl=60)
+        cache.set("a", 1)
+        cache.set("b", 2)
+        cache.get("a")
+        cache.set("c", 3)
+
+        self.assertEqual(cache.get("a"), 1)
+        self.assertIsNone(cache.get("b"))
+        self.assertEqual(cache.get("c"), 3)
+
+    def test_keep_stale_entries_can_be_revalidated(self) -> None:
+        cache = TTLCache(maxsize=4, ttl=10, keep_stale=True)
+        with mock.patch("tools.youtube.cache.time.monotonic", return_value=100.0):
+            cache.set("key", ("etag-1", [{"id": "abc"}]))
+        with mock.patch("tools.youtube.cache.time.monotonic", return_value=111.0):
+            self.assertIsNone(cache.get("key"))
+            self.assertEqual(cache.get_stale("key"), ("etag-1", [{"id": "abc"}]))
+            self.assertTrue(cache.refresh("key"))
+            self.assertEqual(cache.get("key"), ("etag-1", [{"id": "abc"}]))
+        self.assertFalse(cache.refresh("missing"))
+
+
+class SQLiteCacheStoreTest(unittest.TestCase):
+    def setUp(self) -> None:
+        tmpdir = tempfile.TemporaryDirectory()
+        self.addCleanup(tmpdir.cleanup)
+        self.path = os.path.join(tmpdir.name, "cache", "youtube.sqlite3")
+
+    def _cache(self, **kwargs) -> TTLCache:
+        # A fresh store per cache stands in for a restarted process.
+        store = SQLiteCacheStore(self.path, retention=3600)
+        return TTLCache(maxsize=4, ttl=60, store=store, **kwargs)
+
+    def test_entries_survive_a_restart(self) -> None:
+        self._cache(namespace="videos").set("abc", ("etag-1", [{"id": "abc"}]))
+
+        restarted = self._cache(namespace="videos")
+        self.assertEqual(restarted.get("abc"), ["etag-1", [{"id": "abc"}]])
+        self.assertIsNone(self._cache(namespace="channels").get("abc"))
+
+    def test_expired_entries_are_only_served_stale(self) -> None:
+        with mock.patch("tools.youtube.cache.time.time", return_value=1000.0):
+            self._cache(namespace="videos", keep_stale=True).set("abc", ("etag-1", []))
+            self._cache(namespace="search").set("abc", {"id": "abc"})
+
+        with mock.patch("tools.youtube.cache.time.time", return_value=1100.0):
+            stale = self._cache(namespace="videos", keep_stale=True)
+            self.assertIsNone(stale.get("abc"))
+            self.assertEqual(stale.get_stale("abc"), ["etag-1", []])
+            self.assertTrue(stale.refresh("abc"))
+            self.assertEqual(self._cache(namespace="videos").get("abc"), ["etag-1", []])
+            self.assertIsNone(self._cache(namespace="search").get("abc"))
+
+    def test_unserialisable_values_stay_in_memory(self) -> None:
+        cache = self._cache()
+        cache.set("key", {"value": object()})
+        self.assertIsNotNone(cache.get("key"))
+        self.assertIsNone(self._cache().get("key"))
+
+
+if __name__ == "__main__":
+    unittest.main()
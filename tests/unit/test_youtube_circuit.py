@@ -0,0 +1,49 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from tools.youtube.circuit import CircuitBreaker, UpstreamUnavailableError
+
+
+class CircuitBreakerTest(unittest.TestCase):
+    def test_opens_after_consecutive_failures(self) -> None:
+        with mock.patch("tools.youtube.circuit.time.monotonic", return_value=0.0):
+            breaker = CircuitBreaker(fail_max=3, reset_timeout=30)
+            breaker.record_failure()
+            breaker.record_failure()
+            breaker.before_call()
+            breaker.record_failure()
+            with self.assertRaises(UpstreamUnavailableError) as ctx:
+                breaker.before_call()
+        self.assertEqual(ctx.exception.retry_after, 30)
+
+    def test_success_resets_the_failure_count(self) -> None:
+        breaker = CircuitBreaker(fail_max=2, reset_timeout=30)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        self.assertFalse(breaker.is_open)
+
+    def test_probe_after_cooldown_closes_or_reopens(self) -> None:
+        with mock.patch("tools.youtube.circuit.time.monotonic", return_value=0.0):
+            breaker = CircuitBreaker(fail_max=1, reset_timeout=30)
+            breaker.record_failure()
+        with mock.patch("tools.youtube.circuit.time.monotonic", return_value=31.0):
+            breaker.before_call()
+            breaker.record_failure()
+            self.assertTrue(breaker.is_open)
+        with mock.patch("tools.youtube.circuit.time.monotonic", return_value=62.0):
+            breaker.before_call()
+            breaker.record_success()
+            self.assertFalse(breaker.is_open)
+
+    def test_zero_fail_max_disables_the_breaker(self) -> None:
+        breaker = CircuitBreaker(fail_max=0, reset_timeout=30)
+        for _ in range(10):
+            breaker.record_failure()
+        breaker.before_call()
+
+
+if __name__ == "__main__":
+    unittest.main()
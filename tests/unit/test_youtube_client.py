@@ -0,0 +1,132 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from tools.youtube.circuit import CircuitBreaker, UpstreamUnavailableError
+from tools.youtube.client import (
+    execute_batch,
+    execute_conditional_request,
+    execute_request,
+    is_valid_channel_id,
+    is_valid_video_id,
+)
+
+
+class _FakeRequest:
+    methodId = "youtube.videos.list"
+    uri = "https://youtube.googleapis.com/youtube/v3/videos?id=abc&key=secret"
+
+    def __init__(self, status: int = 200, body=None) -> None:
+        self.headers = {}
+        self._status = status
+        self._body = body or {}
+
+    def execute(self, num_retries: int = 0):
+        if self._status >= 300:
+            raise HttpError(httplib2.Response({"status": self._status}), b"", uri=self.uri)
+        return self._body
+
+
+class ExecuteConditionalRequestTest(unittest.TestCase):
+    def setUp(self) -> None:
+        patcher = mock.patch("tools.youtube.client.consume_quota")
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def test_not_modified_returns_none(self) -> None:
+        request = _FakeRequest(status=304)
+        self.assertIsNone(execute_conditional_request(request, etag='"etag-1"'))
+        self.assertEqual(request.headers["If-None-Match"], '"etag-1"')
+
+    def test_modified_returns_fresh_body(self) -> None:
+        request = _FakeRequest(body={"etag": '"etag-2"', "items": [{"id": "abc"}]})
+        response = execute_conditional_request(request, etag='"etag-1"')
+        self.assertEqual(response["etag"], '"etag-2"')
+
+    def test_other_errors_propagate(self) -> None:
+        with self.assertRaises(HttpError):
+            execute_conditional_request(_FakeRequest(status=404), etag='"etag-1"')
+
+
+class _FakeBatch:
+    def __init__(self, callback) -> None:
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self) -> None:
+        for request_id, request in self._requests:
+            try:
+                self._callback(request_id, request.execute(), None)
+            except HttpError as exc:
+                self._callback(request_id, None, exc)
+
+
+class _FakeService:
+    def new_batch_http_request(self, callback=None):
+        return _FakeBatch(callback)
+
+
+class ExecuteBatchTest(unittest.TestCase):
+    def test_results_and_errors_are_keyed_by_request_id(self) -> None:
+        with mock.patch("tools.youtube.client.consume_quota") as consume:
+            results = execute_batch(
+                {
+                    "video": _FakeRequest(body={"items": [{"id": "abc"}]}),
+                    "comments": _FakeRequest(status=403),
+                },
+                service=_FakeService(),
+            )
+        consume.assert_called_once_with("youtube.videos.list", calls=2)
+        self.assertEqual(results["video"], ({"items": [{"id": "abc"}]}, None))
+        self.assertIsNone(results["comments"][0])
+        self.assertIsInstance(results["comments"][1], HttpError)
+
+
+class ExecuteRequestCircuitTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.breaker = CircuitBreaker(fail_max=2, reset_timeout=30)
+        for patcher in (
+            mock.patch("tools.youtube.client.consume_quota"),
+            mock.patch("tools.youtube.client.upstream_breaker", self.breaker),
+        ):
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_server_errors_open_the_circuit(self) -> None:
+        for _ in range(2):
+            with self.assertRaises(HttpError):
+                execute_request(_FakeRequest(status=503), retries=0)
+        with self.assertRaises(UpstreamUnavailableError):
+            execute_request(_FakeRequest(), retries=0)
+
+    def test_client_errors_do_not_count(self) -> None:
+        for _ in range(3):
+            with self.assertRaises(HttpError):
+                execute_request(_FakeRequest(status=404), retries=0)
+        self.assertEqual(execute_request(_FakeRequest(body={"items": []})), {"items": []})
+
+
+class IdValidationTest(unittest.TestCase):
+    def test_video_ids(self) -> None:
+        self.assertTrue(is_valid_video_id("dQw4w9WgXcQ"))
+        self.assertTrue(is_valid_video_id("a-b_c-d_e-f"))
+        for value in (None, "", "dQw4w9WgXc", "dQw4w9WgXcQQ", "dQw4w9WgX Q", "dQw4w9WgXcQ\n"):
+            with self.subTest(value=value):
+                self.assertFalse(is_valid_video_id(value))
+
+    def test_channel_ids(self) -> None:
+        self.assertTrue(is_valid_channel_id("UC_x5XG1OV2P6uZZ5FSM9Ttw"))
+        for value in (None, "", "UCLA", "UU_x5XG1OV2P6uZZ5FSM9Ttw", "@GoogleDevelopers"):
+            with self.subTest(value=value):
+                self.assertFalse(is_valid_channel_id(value))
+
+
+if __name__ == "__main__":
+    unittest.main()
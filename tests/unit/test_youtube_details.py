@@ -0,0 +1,33 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from tools.youtube import details_tool
+from tools.youtube.details_tool import GetChannelDetailsTool
+
+_CHANNEL_ID = "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+
+
+class GetChannelDetailsToolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        for target in ("_channel_details_cache", "get_youtube_service", "_get_channel_batcher"):
+            patcher = mock.patch(f"tools.youtube.details_tool.{target}")
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        details_tool._channel_details_cache.get.return_value = None
+        details_tool._channel_details_cache.get_stale.return_value = None
+        self.batcher = details_tool._get_channel_batcher.return_value
+        self.batcher.get.return_value = ({"id": _CHANNEL_ID}, "etag")
+
+    def test_padded_channel_id_is_stripped_before_lookup(self) -> None:
+        result = GetChannelDetailsTool()(channel_id=f"  {_CHANNEL_ID} ")
+
+        self.assertEqual(result, {"channels": [{"id": _CHANNEL_ID}]})
+        self.batcher.get.assert_called_once_with(_CHANNEL_ID)
+        cache_key = details_tool._channel_details_cache.set.call_args.args[0]
+        self.assertIn(("id", _CHANNEL_ID), cache_key)
+
+
+if __name__ == "__main__":
+    unittest.main()
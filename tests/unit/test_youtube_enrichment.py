@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import unittest
+
+from tools.youtube.enrichment import build_video_record, top_by_views
+
+
+class BuildVideoRecordTest(unittest.TestCase):
+    def test_merges_video_details(self) -> None:
+        detail = {
+            "id": "vid12345678",
+            "snippet": {"publishedAt": "2024-08-01T00:00:00Z", "tags": ["news"]},
+            "statistics": {"viewCount": "1500"},
+            "contentDetails": {"duration": "PT4M5S"},
+            "topicDetails": {"topicCategories": ["politics"]},
+        }
+
+        record = build_video_record("vid12345678", detail)
+
+        self.assertEqual(record["video_id"], "vid12345678")
+        self.assertEqual(record["view_count"], 1500)
+        self.assertEqual(record["publish_date"], "2024-08-01T00:00:00Z")
+        self.assertEqual(record["tags"], ["news"])
+        self.assertEqual(record["duration_seconds"], 245)
+        self.assertEqual(record["duration"], "PT4M5S")
+        self.assertEqual(record["topicDetails"], {"topicCategories": ["politics"]})
+
+    def test_falls_back_to_source_item_without_details(self) -> None:
+        record = build_video_record(
+            "vid12345678",
+            {},
+            snippet={"publishedAt": "2024-08-02T00:00:00Z"},
+            content_details={"videoId": "vid12345678"},
+        )
+
+        self.assertIsNone(record["view_count"])
+        self.assertEqual(record["publish_date"], "2024-08-02T00:00:00Z")
+        self.assertEqual(record["contentDetails"], {"videoId": "vid12345678"})
+        self.assertEqual(record["tags"], [])
+        self.assertNotIn("duration_seconds", record)
+
+    def test_ignores_unparseable_values(self) -> None:
+        detail = {
+            "statistics": {"viewCount": "n/a"},
+            "contentDetails": {"duration": "P0D"},
+        }
+
+        record = build_video_record("live1234567", detail)
+
+        self.assertIsNone(record["view_count"])
+        self.assertNotIn("duration_seconds", record)
+
+
+class TopByViewsTest(unittest.TestCase):
+    def test_returns_most_viewed_first(self) -> None:
+        records = [
+            {"video_id": "a", "view_count": 10},
+            {"video_id": "b", "view_count": None},
+            {"video_id": "c", "view_count": 30},
+            {"video_id": "d", "view_count": 10},
+        ]
+
+        top = top_by_views(records, 3)
+
+        self.assertEqual([record["video_id"] for record in top], ["c", "a", "d"])
+
+
+if __name__ == "__main__":
+    unittest.main()
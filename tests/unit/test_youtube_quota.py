@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+import math
+import unittest
+from unittest import mock
+
+from tools.youtube import quota
+from tools.youtube.quota import (
+    QuotaExceededError,
+    TokenBucket,
+    consume_quota,
+    throttle_requests,
+)
+
+
+class TokenBucketTest(unittest.TestCase):
+    def test_consumes_until_empty_then_refills(self) -> None:
+        with mock.patch("tools.youtube.quota.time.monotonic", return_value=0.0):
+            bucket = TokenBucket(capacity=10, rate=1)
+            self.assertTrue(bucket.try_consume(6))
+            self.assertTrue(bucket.try_consume(4))
+            self.assertFalse(bucket.try_consume(1))
+            self.assertEqual(bucket.retry_after(3), 3)
+        with mock.patch("tools.youtube.quota.time.monotonic", return_value=3.0):
+            self.assertTrue(bucket.try_consume(3))
+
+    def test_refill_is_capped_at_capacity(self) -> None:
+        with mock.patch("tools.youtube.quota.time.monotonic", return_value=0.0):
+            bucket = TokenBucket(capacity=5, rate=1)
+            bucket.try_consume(5)
+        with mock.patch("tools.youtube.quota.time.monotonic", return_value=100.0):
+            self.assertEqual(bucket.tokens, 5)
+            self.assertEqual(bucket.retry_after(6), math.inf)
+
+
+    def test_acquire_sleeps_until_tokens_refill(self) -> None:
+        clock = [0.0]
+
+        def sleep(seconds: float) -> None:
+            clock[0] += seconds
+
+        with (
+            mock.patch("tools.youtube.quota.time.monotonic", side_effect=lambda: clock[0]),
+            mock.patch("tools.youtube.quota.time.sleep", side_effect=sleep) as sleeper,
+        ):
+            bucket = TokenBucket(capacity=2, rate=4)
+            bucket.acquire()
+            bucket.acquire()
+            sleeper.assert_not_called()
+            bucket.acquire()
+        self.assertAlmostEqual(clock[0], 0.25)
+
+    def test_acquire_rejects_costs_above_capacity(self) -> None:
+        with self.assertRaises(ValueError):
+            TokenBucket(capacity=1, rate=1).acquire(2)
+
+
+class ConsumeQuotaTest(unittest.TestCase):
+    def test_search_costs_one_hundred_units(self) -> None:
+        with mock.patch("tools.youtube.quota.time.monotonic", return_value=0.0):
+            bucket = TokenBucket(capacity=150, rate=0.1)
+            with mock.patch.object(quota, "_quota_bucket", bucket):
+                consume_quota("youtube.videos.list", calls=2)
+                consume_quota("youtube.search.list")
+                with self.assertRaises(QuotaExceededError) as ctx:
+                    consume_quota("youtube.search.list")
+        self.assertEqual(ctx.exception.cost, 100)
+        self.assertAlmostEqual(ctx.exception.retry_after, 520.0)
+
+    def test_disabled_budget_never_raises(self) -> None:
+        with mock.patch.object(quota, "_quota_bucket", None):
+            for _ in range(5):
+                consume_quota("youtube.search.list")
+
+
+class ThrottleRequestsTest(unittest.TestCase):
+    def test_batches_take_one_token_per_call(self) -> None:
+        bucket = TokenBucket(capacity=5, rate=1)
+        with mock.patch.object(quota, "_request_bucket", bucket):
+            throttle_requests(3)
+        self.assertLess(bucket.tokens, 2.5)
+
+    def test_disabled_pacing_never_blocks(self) -> None:
+        with (
+            mock.patch.object(quota, "_request_bucket", None),
+            mock.patch("tools.youtube.quota.time.sleep") as sleeper,
+        ):
+            throttle_requests(100)
+        sleeper.assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
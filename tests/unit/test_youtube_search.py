@@ -0,0 +1,133 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from tools.youtube.circuit import UpstreamUnavailableError
+from tools.youtube.quota import QuotaExceededError
+from tools.youtube import search_tool
+from tools.youtube.search_tool import SearchChannelVideosTool, _fetch_video_details_map
+
+_CHANNEL_ID = "UC_x5XG1OV2P6uZZ5FSM9Ttw"
+_SEARCH_ITEMS = [
+    {"id": {"videoId": "dQw4w9WgXcQ"}, "snippet": {"title": "First"}},
+    {"id": {"videoId": "a-b_c-d_e-f"}, "snippet": {"title": "Second"}},
+]
+
+
+class _FakeVideosRequest:
+    methodId = "youtube.videos.list"
+
+    def __init__(self, ids) -> None:
+        self.ids = ids
+
+    def execute(self, num_retries: int = 0):
+        if "broken" in self.ids:
+            raise RuntimeError("chunk failed")
+        return {"items": [{"id": video_id} for video_id in self.ids]}
+
+
+class _FakeBatch:
+    def __init__(self, service, callback) -> None:
+        self._service = service
+        self._callback = callback
+        self._requests = []
+
+    def add(self, request, request_id=None) -> None:
+        self._requests.append((request_id, request))
+
+    def execute(self) -> None:
+        self._service.batches.append([request.ids for _, request in self._requests])
+        for request_id, request in self._requests:
+            try:
+                self._callback(request_id, request.execute(), None)
+            except RuntimeError as exc:
+                self._callback(request_id, None, exc)
+
+
+class _FakeService:
+    def __init__(self) -> None:
+        self.batches = []
+
+    def videos(self):
+        return self
+
+    def list(self, *, part, id, fields):
+        return _FakeVideosRequest(id.split(","))
+
+    def new_batch_http_request(self, callback=None):
+        return _FakeBatch(self, callback)
+
+
+class FetchVideoDetailsMapTest(unittest.TestCase):
+    def setUp(self) -> None:
+        for target in (
+            "tools.youtube.search_tool._video_details_cache",
+            "tools.youtube.search_tool.execute_request",
+            "tools.youtube.client.consume_quota",
+            "tools.youtube.client.throttle_requests",
+        ):
+            patcher = mock.patch(target)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+        search_tool._video_details_cache.get.return_value = None
+        self.service = _FakeService()
+
+    def test_more_than_fifty_ids_share_one_batch_round_trip(self) -> None:
+        video_ids = [f"video{index:06d}" for index in range(120)]
+
+        details = _fetch_video_details_map(self.service, video_ids)
+
+        search_tool.execute_request.assert_not_called()
+        self.assertEqual(len(self.service.batches), 1)
+        self.assertEqual([len(chunk) for chunk in self.service.batches[0]], [50, 50, 20])
+        self.assertEqual(list(details), video_ids)
+        self.assertEqual(search_tool._video_details_cache.set.call_count, 120)
+
+    def test_a_failed_chunk_raises(self) -> None:
+        video_ids = [f"video{index:06d}" for index in range(59)] + ["broken"]
+
+        with self.assertRaises(RuntimeError):
+            _fetch_video_details_map(self.service, video_ids)
+
+
+class SearchChannelVideosDetailsErrorTest(unittest.TestCase):
+    def setUp(self) -> None:
+        for target, kwargs in (
+            ("resolve_channel_identifier", {"return_value": _CHANNEL_ID}),
+            ("get_youtube_service", {}),
+            ("_search_videos", {"side_effect": lambda service, params: list(_SEARCH_ITEMS)}),
+        ):
+            patcher = mock.patch(f"tools.youtube.search_tool.{target}", **kwargs)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def _search(self, error: Exception):
+        with mock.patch(
+            "tools.youtube.search_tool._fetch_video_details_map", side_effect=error
+        ), self.assertNoLogs("tools.youtube.search_tool", level="ERROR"):
+            return SearchChannelVideosTool()(
+                _CHANNEL_ID,
+                published_after="2024-01-01",
+                published_before="2024-02-01",
+                order="date",
+            )
+
+    def test_quota_exhaustion_returns_unenriched_videos(self) -> None:
+        result = self._search(QuotaExceededError("youtube.videos.list", 1, retry_after=42))
+
+        self.assertNotIn("error", result)
+        self.assertEqual(len(result["videos"]), 2)
+        self.assertEqual(result["details_error"], "YouTube quota budget exhausted.")
+        self.assertEqual(result["retry_after"], 42)
+
+    def test_open_circuit_returns_unenriched_videos(self) -> None:
+        result = self._search(UpstreamUnavailableError(retry_after=30))
+
+        self.assertEqual(len(result["videos"]), 2)
+        self.assertEqual(result["details_error"], "YouTube API temporarily unavailable.")
+        self.assertEqual(result["retry_after"], 30)
+
+
+if __name__ == "__main__":
+    unittest.main()
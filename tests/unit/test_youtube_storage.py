@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import unittest
+from types import SimpleNamespace
+from unittest import mock
+
+from tools.youtube.storage import bulk_upload_texts_to_gemini_files, upload_text_to_gemini_file
+
+
+class _FakeFiles:
+    def __init__(self) -> None:
+        self.uploads = []
+
+    def upload(self, *, file, config=None):
+        if config["display_name"] == "broken":
+            raise RuntimeError("upload rejected")
+        self.uploads.append((file.read(), config))
+        return SimpleNamespace(name=f"files/{len(self.uploads)}")
+
+    def get(self, *, name):
+        return SimpleNamespace(state="ACTIVE", uri=f"https://example.invalid/{name}")
+
+
+class _FakeClientTestCase(unittest.TestCase):
+    def setUp(self) -> None:
+        self.client = SimpleNamespace(files=_FakeFiles())
+        patcher = mock.patch("tools.youtube.storage.get_genai_client", return_value=self.client)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+
+class UploadTextToGeminiFileTest(_FakeClientTestCase):
+    def test_uploads_from_memory_with_display_name(self) -> None:
+        uri = upload_text_to_gemini_file(text="Привіт", display_name="Transcript abc")
+
+        self.assertEqual(uri, "https://example.invalid/files/1")
+        self.assertEqual(
+            self.client.files.uploads,
+            [
+                (
+                    "Привіт".encode("utf-8"),
+                    {"mime_type": "text/plain", "display_name": "Transcript abc"},
+                )
+            ],
+        )
+
+
+class BulkUploadTextsToGeminiFilesTest(_FakeClientTestCase):
+    def test_results_keep_input_order_and_isolate_failures(self) -> None:
+        results = bulk_upload_texts_to_gemini_files(
+            [("one", "first"), ("two", "broken"), ("three", "third")]
+        )
+
+        self.assertEqual(len(results), 3)
+        self.assertTrue(results[0].startswith("https://example.invalid/files/"))
+        self.assertIsInstance(results[1], RuntimeError)
+        self.assertTrue(results[2].startswith("https://example.invalid/files/"))
+        self.assertEqual(
+            sorted(config["display_name"] for _, config in self.client.files.uploads),
+            ["first", "third"],
+        )
+
+    def test_empty_input_uploads_nothing(self) -> None:
+        self.assertEqual(bulk_upload_texts_to_gemini_files([]), [])
+        self.assertEqual(self.client.files.uploads, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
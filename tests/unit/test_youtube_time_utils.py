@@ -0,0 +1,70 @@
+from __future__ import annotations
+
+import unittest
+from datetime import datetime, timezone
+
+from tools.youtube.time_utils import (
+    maybe_normalize_timestamp,
+    parse_iso8601_duration,
+    parse_rfc3339,
+)
+
+
+class MaybeNormalizeTimestampTest(unittest.TestCase):
+    def test_canonical_timestamp_is_returned_unchanged(self) -> None:
+        value = "2024-09-01T00:00:00Z"
+        self.assertIs(maybe_normalize_timestamp(value), value)
+
+    def test_other_inputs_are_normalized(self) -> None:
+        self.assertEqual(
+            maybe_normalize_timestamp("2024-09-01"), "2024-09-01T00:00:00Z"
+        )
+        self.assertEqual(
+            maybe_normalize_timestamp(" 2024-09-01T02:00:00+02:00 "),
+            "2024-09-01T00:00:00Z",
+        )
+        self.assertIsNone(maybe_normalize_timestamp(""))
+        self.assertEqual(maybe_normalize_timestamp("yesterday"), "yesterday")
+
+
+class ParseRfc3339Test(unittest.TestCase):
+    def test_canonical_timestamp(self) -> None:
+        self.assertEqual(
+            parse_rfc3339("2024-08-01T12:34:56Z"),
+            datetime(2024, 8, 1, 12, 34, 56, tzinfo=timezone.utc),
+        )
+
+    def test_offset_and_fractional_timestamps_fall_back(self) -> None:
+        self.assertEqual(
+            parse_rfc3339("2024-08-01T14:34:56+02:00"),
+            datetime(2024, 8, 1, 12, 34, 56, tzinfo=timezone.utc),
+        )
+        self.assertEqual(
+            parse_rfc3339("2024-08-01T12:34:56.250Z"),
+            datetime(2024, 8, 1, 12, 34, 56, 250000, tzinfo=timezone.utc),
+        )
+
+    def test_invalid_values_return_none(self) -> None:
+        self.assertIsNone(parse_rfc3339(None))
+        self.assertIsNone(parse_rfc3339(""))
+        self.assertIsNone(parse_rfc3339("2024-13-01T00:00:00Z"))
+        self.assertIsNone(parse_rfc3339("not a timestamp"))
+
+
+class ParseIso8601DurationTest(unittest.TestCase):
+    def test_parses_hours_minutes_seconds(self) -> None:
+        self.assertEqual(parse_iso8601_duration("PT1H5M10S"), 3910)
+        self.assertEqual(parse_iso8601_duration("PT12M"), 720)
+        self.assertEqual(parse_iso8601_duration("PT45S"), 45)
+        self.assertEqual(parse_iso8601_duration("PT2H"), 7200)
+        self.assertEqual(parse_iso8601_duration("PT0S"), 0)
+
+    def test_rejects_malformed_durations(self) -> None:
+        for value in ("P1D", "1H5M", "PT5X", "PT10", "PTM", "PT1.5S", "PT\u00b2S"):
+            with self.subTest(value=value):
+                with self.assertRaises(ValueError):
+                    parse_iso8601_duration(value)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+from tools.youtube.transcript_upload_tool import UploadTranscriptToGeminiFileTool
+
+
+class UploadTranscriptToGeminiFileToolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tool = UploadTranscriptToGeminiFileTool()
+
+    def test_transcripts_list_uploads_in_one_bulk_call(self) -> None:
+        with mock.patch(
+            "tools.youtube.transcript_upload_tool.bulk_upload_texts_to_gemini_files",
+            return_value=["https://example.invalid/files/1", RuntimeError("rejected")],
+        ) as bulk:
+            result = self.tool(
+                transcripts=[
+                    {"video_id": "dQw4w9WgXcQ", "transcript_text": "one", "video_title": "First"},
+                    {"video_id": "a-b_c-d_e-f", "transcript_text": "two"},
+                ]
+            )
+
+        bulk.assert_called_once_with([("one", "First"), ("two", "Transcript a-b_c-d_e-f")])
+        self.assertEqual(result["status"], "partial")
+        self.assertEqual(
+            result["files"][0],
+            {"video_id": "dQw4w9WgXcQ", "file_uri": "https://example.invalid/files/1"},
+        )
+        self.assertEqual(result["files"][1]["video_id"], "a-b_c-d_e-f")
+        self.assertIn("rejected", result["files"][1]["error"])
+
+    def test_invalid_transcripts_are_rejected_before_uploading(self) -> None:
+        with mock.patch(
+            "tools.youtube.transcript_upload_tool.bulk_upload_texts_to_gemini_files"
+        ) as bulk:
+            result = self.tool(transcripts=[{"video_id": "dQw4w9WgXcQ"}])
+
+        bulk.assert_not_called()
+        self.assertEqual(result["status"], "error")
+
+    def test_single_upload_still_works(self) -> None:
+        with mock.patch(
+            "tools.youtube.transcript_upload_tool.upload_text_to_gemini_file",
+            return_value="https://example.invalid/files/1",
+        ) as upload:
+            result = self.tool("dQw4w9WgXcQ", "text")
+
+        upload.assert_called_once_with(text="text", display_name="Transcript dQw4w9WgXcQ")
+        self.assertEqual(result["status"], "success")
+        self.assertEqual(result["file_uri"], "https://example.invalid/files/1")
+
+    def test_missing_single_upload_fields_are_an_error(self) -> None:
+        self.assertEqual(self.tool(video_id="dQw4w9WgXcQ")["status"], "error")
+
+
+if __name__ == "__main__":
+    unittest.main()
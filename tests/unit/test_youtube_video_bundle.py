@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import unittest
+from unittest import mock
+
+import httplib2
+from googleapiclient.errors import HttpError
+
+from tools.youtube.quota import QuotaExceededError
+from tools.youtube.video_bundle_tool import GetVideoBundleTool
+
+_VIDEO_ID = "dQw4w9WgXcQ"
+_VIDEO = {"id": _VIDEO_ID, "contentDetails": {"duration": "PT3M33S"}}
+_COMMENTS = [{"id": "comment-1"}]
+
+
+def _http_error(status: int) -> HttpError:
+    return HttpError(httplib2.Response({"status": status}), b"", uri="https://example.invalid")
+
+
+class GetVideoBundleToolTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tool = GetVideoBundleTool()
+        self.mocks = {}
+        for name, kwargs in (
+            ("cached_video_items", {"return_value": None}),
+            ("cached_comments", {"return_value": None}),
+            ("store_video_response", {"side_effect": lambda video_id, response: response["items"]}),
+            ("store_comments", {}),
+            ("load_video_items", {"return_value": [_VIDEO]}),
+            ("get_youtube_service", {}),
+            ("execute_batch", {}),
+            ("execute_request", {}),
+            ("comment_threads_request", {}),
+            ("videos_request", {}),
+        ):
+            patcher = mock.patch(f"tools.youtube.video_bundle_tool.{name}", **kwargs)
+            self.mocks[name] = patcher.start()
+            self.addCleanup(patcher.stop)
+
+    def test_uncached_video_and_comments_share_one_batch(self) -> None:
+        self.mocks["execute_batch"].return_value = {
+            "video": ({"items": [_VIDEO]}, None),
+            "comments": ({"items": _COMMENTS}, None),
+        }
+
+        result = self.tool(_VIDEO_ID)
+
+        self.assertEqual(result["video"], _VIDEO)
+        self.assertEqual(result["comments"], _COMMENTS)
+        self.assertEqual(result["duration_seconds"], 213)
+        self.mocks["store_comments"].assert_called_once_with(_VIDEO_ID, 20, _COMMENTS)
+        self.mocks["execute_request"].assert_not_called()
+
+    def test_batched_comment_failure_keeps_video_details(self) -> None:
+        self.mocks["execute_batch"].return_value = {
+            "video": ({"items": [_VIDEO]}, None),
+            "comments": (None, _http_error(403)),
+        }
+
+        result = self.tool(_VIDEO_ID)
+
+        self.assertEqual(result["video"], _VIDEO)
+        self.assertEqual(result["comments"], [])
+        self.assertTrue(result["comments_error"].startswith("YouTube API error"))
+        self.mocks["store_comments"].assert_not_called()
+
+    def test_batched_video_failure_is_an_error(self) -> None:
+        self.mocks["execute_batch"].return_value = {
+            "video": (None, _http_error(500)),
+            "comments": ({"items": _COMMENTS}, None),
+        }
+
+        result = self.tool(_VIDEO_ID)
+
+        self.assertNotIn("video", result)
+        self.assertTrue(result["error"].startswith("YouTube API error"))
+
+    def test_cached_comments_only_load_the_video(self) -> None:
+        self.mocks["cached_comments"].return_value = _COMMENTS
+
+        result = self.tool(_VIDEO_ID)
+
+        self.assertEqual(result["comments"], _COMMENTS)
+        self.mocks["load_video_items"].assert_called_once_with(_VIDEO_ID)
+        self.mocks["execute_batch"].assert_not_called()
+        self.mocks["execute_request"].assert_not_called()
+
+    def test_comment_quota_error_keeps_cached_video(self) -> None:
+        self.mocks["cached_video_items"].return_value = [_VIDEO]
+        self.mocks["execute_request"].side_effect = QuotaExceededError(
+            "youtube.commentThreads.list", 1, retry_after=60
+        )
+
+        result = self.tool(_VIDEO_ID)
+
+        self.assertNotIn("error", result)
+        self.assertEqual(result["video"], _VIDEO)
+        self.assertEqual(result["comments_error"], "YouTube quota budget exhausted.")
+        self.mocks["load_video_items"].assert_not_called()
+        self.mocks["execute_batch"].assert_not_called()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -14,6 +14,7 @@ from .batch_tool import (
 )
 from .youtube_tool import (
     GetLatestVideosTool,
+    GetVideoBundleTool,
     GetVideoCommentsTool,
     SearchChannelVideosTool,
     GetVideoDetailsTool,
@@ -31,6 +32,7 @@ __all__ = [
     "SubmitBatchJobTool",
     "GetBatchResultsTool",
     "GetLatestVideosTool",
+    "GetVideoBundleTool",
     "GetVideoCommentsTool",
     "GetVideoDetailsTool",
     "GetChannelDetailsTool",
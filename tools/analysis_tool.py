@@ -7,9 +7,12 @@ from typing import Any, Dict, List
 
 from google import genai
 from google.genai import types
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from pydantic import BaseModel, Field
 
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking
+
 logger = logging.getLogger(__name__)
 
 MODEL_NAME = "gemini-flash-latest"
@@ -27,7 +30,7 @@ class FileAnalysisInput(BaseModel):
     )
 
 
-class FileAnalysisTool(BaseTool):
+class FileAnalysisTool(DeclarationCacheMixin, BaseTool):
     """Make a fresh Gemini call that reads uploaded files and answers a query."""
 
     NAME = "analysis_tool"
@@ -42,16 +45,9 @@ class FileAnalysisTool(BaseTool):
     def args_schema(self) -> type[FileAnalysisInput]:
         return FileAnalysisInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
+        return await run_blocking(
+            self,
             file_uris=args["file_uris"],
             query=args["query"],
         )
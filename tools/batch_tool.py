@@ -5,10 +5,11 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, List, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from services.batch_service import BatchJobService, BatchModeUnavailableError
+from tools.declarations import DeclarationCacheMixin
 from tools.transcript_tool import AnalyzeVideoTool
 from memory import get_file_search_service
 
@@ -26,7 +27,7 @@ class SubmitBatchJobInput(BaseModel):
     )
 
 
-class SubmitBatchJobTool(BaseTool):
+class SubmitBatchJobTool(DeclarationCacheMixin, BaseTool):
     """Tool to submit a batch analysis job for multiple videos."""
 
     NAME = "submit_batch_job"
@@ -48,14 +49,6 @@ class SubmitBatchJobTool(BaseTool):
     def args_schema(self) -> type[SubmitBatchJobInput]:
         return SubmitBatchJobInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
         return await self(
             video_ids=args["video_ids"],
@@ -131,7 +124,7 @@ class GetBatchResultsInput(BaseModel):
     )
 
 
-class GetBatchResultsTool(BaseTool):
+class GetBatchResultsTool(DeclarationCacheMixin, BaseTool):
     """Tool to check status and retrieve results of a batch job."""
 
     NAME = "get_batch_results"
@@ -151,14 +144,6 @@ class GetBatchResultsTool(BaseTool):
     def args_schema(self) -> type[GetBatchResultsInput]:
         return GetBatchResultsInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
         return await self(
             job_id=args["job_id"],
@@ -4,11 +4,13 @@ from __future__ import annotations
 
 from typing import Any, Dict, List, Literal, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from channel_registry.manager import ChannelRegistryManager
 from channel_registry.refresh_service import ChannelRefreshService
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking
 
 
 class RefreshChannelInput(BaseModel):
@@ -22,7 +24,7 @@ class RefreshChannelInput(BaseModel):
     )
 
 
-class RefreshChannelMetadataTool(BaseTool):
+class RefreshChannelMetadataTool(DeclarationCacheMixin, BaseTool):
     """Fetch channel snippet/statistics and update the registry + memory."""
 
     NAME = "refresh_channel_metadata"
@@ -41,16 +43,12 @@ class RefreshChannelMetadataTool(BaseTool):
     def args_schema(self) -> type[RefreshChannelInput]:
         return RefreshChannelInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(identifier=args["identifier"], force=args.get("force", False))
+        return await run_blocking(
+            self,
+            identifier=args["identifier"],
+            force=args.get("force", False),
+        )
 
     def __call__(self, identifier: str, force: bool = False) -> Dict[str, Any]:  # type: ignore[override]
         record = self._service.refresh(identifier, force=force)
@@ -75,7 +73,7 @@ class ManageChannelInput(BaseModel):
     force: bool = Field(default=False, description="Force refresh when action is refresh.")
 
 
-class ManageChannelRegistryTool(BaseTool):
+class ManageChannelRegistryTool(DeclarationCacheMixin, BaseTool):
     """Menu-friendly tool for viewing and editing the channel registry."""
 
     NAME = "manage_channel_registry"
@@ -92,16 +90,8 @@ class ManageChannelRegistryTool(BaseTool):
     def args_schema(self) -> type[ManageChannelInput]:
         return ManageChannelInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(**args)
+        return await run_blocking(self, **args)
 
     def __call__(  # type: ignore[override]
         self,
@@ -0,0 +1,38 @@
+"""Shared helpers for building ADK function declarations."""
+
+from __future__ import annotations
+
+from typing import Any, Dict
+
+from google.adk.tools import _automatic_function_calling_util as tool_utils
+
+
+class DeclarationCacheMixin:
+    """
+    Build a tool's FunctionDeclaration once per class and API variant.
+
+    ADK asks every tool for its declaration on each LLM request, and building
+    one walks the Pydantic schema. The schema and name are fixed per class, so
+    the first result is cached on the class. Mix in before `BaseTool`; the
+    tool must define `NAME` and `args_schema`.
+    """
+
+    def _get_declaration(self):
+        cls = type(self)
+        cache: Dict[Any, Any] = cls.__dict__.get("_declaration_cache")
+        if cache is None:
+            cache = {}
+            cls._declaration_cache = cache
+        variant = self._api_variant
+        declaration = cache.get(variant)
+        if declaration is None:
+            declaration = tool_utils.build_function_declaration(
+                func=self.args_schema,
+                variant=variant,
+            )
+            declaration.name = self.NAME
+            cache[variant] = declaration
+        return declaration
+
+
+__all__ = ["DeclarationCacheMixin"]
@@ -0,0 +1,83 @@
+"""Process-wide worker pools for the blocking work behind ADK tools."""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import contextvars
+import copy
+import functools
+import json
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, TypeVar
+
+from config.settings import TOOL_BACKGROUND_MAX_WORKERS, TOOL_MAX_WORKERS
+
+_T = TypeVar("_T")
+
+_tool_executor = ThreadPoolExecutor(
+    max_workers=TOOL_MAX_WORKERS,
+    thread_name_prefix="tool",
+)
+atexit.register(_tool_executor.shutdown, wait=False)
+
+_background_executor = ThreadPoolExecutor(
+    max_workers=TOOL_BACKGROUND_MAX_WORKERS,
+    thread_name_prefix="tool-background",
+)
+atexit.register(_background_executor.shutdown, wait=False)
+
+_inflight: Dict[Hashable, asyncio.Future] = {}
+
+
+async def run_blocking(func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> _T:
+    """
+    Run a blocking tool call on the shared worker pool.
+
+    Like `asyncio.to_thread`, but on a dedicated, bounded executor so tool
+    calls neither compete with other default-executor work nor spawn
+    unbounded threads. Context variables (tracing spans) are propagated.
+    """
+    loop = asyncio.get_running_loop()
+    context = contextvars.copy_context()
+    call = functools.partial(context.run, func, *args, **kwargs)
+    return await loop.run_in_executor(_tool_executor, call)
+
+
+async def run_blocking_coalesced(func: Callable[..., _T], /, **kwargs: Any) -> _T:
+    """
+    Like `run_blocking`, but identical concurrent calls share one execution.
+
+    Agents often fire the same read-only tool call twice in one turn; callers
+    that arrive while a call with the same `func` and arguments is in flight
+    await its result (a private copy) instead of repeating the API request.
+    """
+    loop = asyncio.get_running_loop()
+    key = (id(loop), func, json.dumps(kwargs, sort_keys=True, default=repr))
+    pending = _inflight.get(key)
+    if pending is not None:
+        return copy.deepcopy(await asyncio.shield(pending))
+
+    future = asyncio.ensure_future(run_blocking(func, **kwargs))
+    _inflight[key] = future
+
+    def _forget(done: asyncio.Future) -> None:
+        if _inflight.get(key) is done:
+            del _inflight[key]
+
+    future.add_done_callback(_forget)
+    # Shielded so a cancelled caller doesn't cancel the call for the others.
+    return await asyncio.shield(future)
+
+
+def submit_blocking(func: Callable[..., _T], /, *args: Any, **kwargs: Any) -> Future:
+    """
+    Schedule fire-and-forget work (e.g. background ingestion) on its own pool.
+
+    Background jobs are slow uploads plus polling; keeping them off the tool
+    pool means a burst of them cannot delay foreground tool calls.
+    """
+    return _background_executor.submit(func, *args, **kwargs)
+
+
+__all__ = ["run_blocking", "run_blocking_coalesced", "submit_blocking"]
@@ -6,10 +6,12 @@ import json
 import logging
 from typing import Any, Dict, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from pydantic import BaseModel, Field
 
 from memory import get_file_search_service
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking
 
 logger = logging.getLogger(__name__)
 
@@ -43,7 +45,7 @@ class QueryStoreInput(BaseModel):
     )
 
 
-class CreateFileSearchStoreTool(BaseTool):
+class CreateFileSearchStoreTool(DeclarationCacheMixin, BaseTool):
     """Provision a new Gemini File Search store."""
 
     NAME = "create_file_search_store"
@@ -59,23 +61,15 @@ class CreateFileSearchStoreTool(BaseTool):
     def args_schema(self) -> type[CreateStoreInput]:
         return CreateStoreInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: Dict[str, Any], tool_context) -> Dict[str, str]:
-        return self(display_name=args["display_name"])
+        return await run_blocking(self, display_name=args["display_name"])
 
     def __call__(self, display_name: str) -> Dict[str, str]:  # type: ignore[override]
         service = get_file_search_service()
         return service.create_store(display_name=display_name)
 
 
-class UploadFileSearchDocumentTool(BaseTool):
+class UploadFileSearchDocumentTool(DeclarationCacheMixin, BaseTool):
     """Upload text content into an existing File Search store."""
 
 
@@ -93,18 +87,11 @@ class UploadFileSearchDocumentTool(BaseTool):
     def args_schema(self) -> type[UploadDocumentInput]:
         return UploadDocumentInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: Dict[str, Any], tool_context) -> Dict[str, Optional[str]]:
         metadata_str = args.get("metadata", "")
         metadata = json.loads(metadata_str) if metadata_str else None
-        return self(
+        return await run_blocking(
+            self,
             store_name=args["store_name"],
             text_content=args["text_content"],
             document_display_name=args["document_display_name"],
@@ -130,7 +117,7 @@ class UploadFileSearchDocumentTool(BaseTool):
         )
 
 
-class QueryFileSearchStoreTool(BaseTool):
+class QueryFileSearchStoreTool(DeclarationCacheMixin, BaseTool):
     """Query a File Search store and return grounded snippets."""
 
     NAME = "query_file_search_store"
@@ -148,16 +135,9 @@ class QueryFileSearchStoreTool(BaseTool):
     def args_schema(self) -> type[QueryStoreInput]:
         return QueryStoreInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: Dict[str, Any], tool_context) -> Dict[str, object]:
-        return self(
+        return await run_blocking(
+            self,
             store_name=args["store_name"],
             query=args["query"],
             top_k=args.get("top_k", 5),
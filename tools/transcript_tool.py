@@ -3,21 +3,17 @@
 from __future__ import annotations
 
 import asyncio
+import io
 import json
 import logging
-import os
 import re
-import tempfile
-import time
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import TYPE_CHECKING, Any, Dict, List, Optional
 
 from google import genai
 from google.genai import types
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
-from googleapiclient.discovery import build  # Import build
+from google.adk.tools import BaseTool
 from pydantic import BaseModel, Field
-from simargl_agent.schemas import TranscriptSegment, VideoData
 from youtube_transcript_api import (
     NoTranscriptFound,
     TranscriptsDisabled,
@@ -27,9 +23,16 @@ from youtube_transcript_api import (
 from config.settings import (
     BASE_DIR,
     DEFAULT_GEMINI_MODEL,
-    YOUTUBE_API_KEY,  # Import API Key
 )
 from memory import get_file_search_service
+from tools.declarations import DeclarationCacheMixin
+from tools.youtube.client import execute_request, get_youtube_service
+from tools.youtube.storage import wait_for_file_active
+from tools.youtube.time_utils import parse_iso8601_duration
+
+if TYPE_CHECKING:
+    # Importing simargl_agent runs agent.py, which imports this module via tools_config.
+    from simargl_agent.schemas import TranscriptSegment, VideoData
 
 
 logger = logging.getLogger(__name__)
@@ -37,9 +40,6 @@ logger = logging.getLogger(__name__)
 # Local storage directory for video artifacts
 ARTIFACTS_BASE_DIR = BASE_DIR / "data" / "video_artifacts"
 
-FILE_POLL_INTERVAL_SECONDS = 1.0
-FILE_POLL_TIMEOUT_SECONDS = 120.0
-
 
 class EmotionAnalysis(BaseModel):
     """Emotion detected at a specific moment."""
@@ -124,7 +124,7 @@ class AnalyzeVideoInput(BaseModel):
     )
 
 
-class AnalyzeVideoTool(BaseTool):
+class AnalyzeVideoTool(DeclarationCacheMixin, BaseTool):
     """
     Generates a YouTube transcript with Gemini, uploads it to Gemini Files,
     and returns a file_uri reference instead of raw text to avoid context bloat.
@@ -154,14 +154,6 @@ class AnalyzeVideoTool(BaseTool):
     def args_schema(self) -> type[AnalyzeVideoInput]:
         return AnalyzeVideoInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     def _extract_video_id(self, video_url: str) -> Optional[str]:
         """Extract video ID from YouTube URL."""
         try:
@@ -176,24 +168,15 @@ class AnalyzeVideoTool(BaseTool):
     def _get_video_details_from_api(self, video_id: str) -> int:
         """Fetch video duration from YouTube API."""
         try:
-            service = build("youtube", "v3", developerKey=YOUTUBE_API_KEY, cache_discovery=False)
+            service = get_youtube_service()
             request = service.videos().list(part="contentDetails", id=video_id)
-            response = request.execute()
+            response = execute_request(request, retries=2, label="video duration")
             items = response.get("items", [])
             if not items:
                 return 0
-            
+
             duration_iso = items[0]["contentDetails"]["duration"]
-            # Minimal parser for PT#H#M#S
-            import re
-            pattern = r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?"
-            match = re.match(pattern, duration_iso)
-            if not match:
-                return 0
-            hours = int(match.group(1) or 0)
-            minutes = int(match.group(2) or 0)
-            seconds = int(match.group(3) or 0)
-            return hours * 3600 + minutes * 60 + seconds
+            return parse_iso8601_duration(duration_iso)
         except Exception as e:
             logger.error(f"Failed to fetch video details for {video_id}: {e}")
             return 0
@@ -214,16 +197,8 @@ class AnalyzeVideoTool(BaseTool):
         return artifact_file
 
     def _wait_for_file_active(self, file_name: str) -> str:
-        """Poll Gemini Files until the upload is ACTIVE or times out."""
-        client = self._get_client()
-        deadline = time.time() + FILE_POLL_TIMEOUT_SECONDS
-        current = client.files.get(name=file_name)
-        while current.state not in {"ACTIVE", "FAILED"} and time.time() < deadline:
-            time.sleep(FILE_POLL_INTERVAL_SECONDS)
-            current = client.files.get(name=file_name)
-        if current.state != "ACTIVE":
-            raise RuntimeError(f"Transcript upload did not become ACTIVE (state={current.state})")
-        return current.uri
+        """Poll Gemini Files (with backoff) until the upload is ACTIVE or times out."""
+        return wait_for_file_active(self._get_client(), name=file_name)
 
     def _upload_transcript_text(
         self,
@@ -234,27 +209,15 @@ class AnalyzeVideoTool(BaseTool):
     ) -> str:
         """Persist transcript text to Gemini Files and return a file_uri."""
         client = self._get_client()
-        temp_path = None
-        try:
-            with tempfile.NamedTemporaryFile(
-                mode="w",
-                suffix=".txt",
-                delete=False,
-                encoding="utf-8",
-            ) as tmp:
-                tmp.write(transcript_text)
-                tmp.flush()
-                temp_path = tmp.name
-            display_name = video_title or f"Transcript {video_id}"
-            # Gemini API backend does not support display_name; upload with file only.
-            upload = client.files.upload(file=temp_path)
-            return self._wait_for_file_active(upload.name)
-        finally:
-            if temp_path and os.path.exists(temp_path):
-                try:
-                    os.remove(temp_path)
-                except OSError:
-                    logger.debug("Temporary transcript file already removed: %s", temp_path)
+        # The mime type is required because an in-memory buffer has no file extension.
+        upload = client.files.upload(
+            file=io.BytesIO(transcript_text.encode("utf-8")),
+            config={
+                "mime_type": "text/plain",
+                "display_name": video_title or f"Transcript {video_id}",
+            },
+        )
+        return self._wait_for_file_active(upload.name)
 
     def _format_timestamp(self, seconds: float) -> str:
         minutes = int(seconds // 60)
@@ -270,6 +233,8 @@ class AnalyzeVideoTool(BaseTool):
         return "\n".join(lines).strip()
 
     def _parse_markdown_segments(self, text: str) -> List[TranscriptSegment]:
+        from simargl_agent.schemas import TranscriptSegment
+
         pattern = re.compile(r"\[(\d{1,2}):(\d{2})\]\s*(.+)")
         parsed: List[TranscriptSegment] = []
         for line in text.splitlines():
@@ -333,6 +298,8 @@ class AnalyzeVideoTool(BaseTool):
         return ordered
 
     def _get_video_data_via_transcript_api(self, video_id: str, channel_id: Optional[str]) -> VideoData:
+        from simargl_agent.schemas import TranscriptSegment, VideoData
+
         ytt_api = YouTubeTranscriptApi()
         transcripts = ytt_api.list(video_id)
 
@@ -384,6 +351,8 @@ class AnalyzeVideoTool(BaseTool):
         return data
 
     def _get_video_data_via_gemini(self, video_id: str) -> VideoData:
+        from simargl_agent.schemas import VideoData
+
         client = self._get_client()
         video_url = f"https://www.youtube.com/watch?v={video_id}"
         prompt = (
@@ -1,6 +1,7 @@
 """YouTube tooling package with shared helpers and ADK tool wrappers."""
 
 from .client import (
+    execute_batch,
     execute_request,
     get_youtube_service,
     redact_request_uri,
@@ -28,14 +29,17 @@ from .time_utils import (
     format_rfc3339,
     maybe_normalize_timestamp,
     parse_iso8601_duration,
+    parse_rfc3339,
 )
 from .transcript_upload_tool import (
     UploadTranscriptToGeminiFileInput,
     UploadTranscriptToGeminiFileTool,
 )
-from .storage import upload_text_to_gemini_file
+from .video_bundle_tool import GetVideoBundleTool, VideoBundleInput
+from .storage import bulk_upload_texts_to_gemini_files, upload_text_to_gemini_file
 
 __all__ = [
+    "execute_batch",
     "execute_request",
     "get_youtube_service",
     "redact_request_uri",
@@ -43,6 +47,8 @@ __all__ = [
     "format_rfc3339",
     "maybe_normalize_timestamp",
     "parse_iso8601_duration",
+    "parse_rfc3339",
+    "bulk_upload_texts_to_gemini_files",
     "upload_text_to_gemini_file",
     "LatestVideosInput",
     "GetLatestVideosTool",
@@ -60,4 +66,6 @@ __all__ = [
     "EnrichPlaylistVideosTool",
     "UploadTranscriptToGeminiFileInput",
     "UploadTranscriptToGeminiFileTool",
+    "VideoBundleInput",
+    "GetVideoBundleTool",
 ]
@@ -0,0 +1,87 @@
+"""Coalesce concurrent single-id lookups into multi-id YouTube API calls."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+
+class IdBatcher:
+    """
+    Micro-batcher for list endpoints that accept up to 50 comma-separated ids.
+
+    Tools run in worker threads, so the first caller in a quiet period becomes the
+    leader: it waits `window` seconds for other threads to enqueue their ids,
+    then issues `fetch` for a batch of up to `max_batch` ids that includes its
+    own. Once its batch resolves, the leader hands leadership to a caller whose
+    id is still pending, or releases it if none is, so no caller fetches on
+    behalf of ids that arrived after it. Every caller receives the item for its
+    id, or None when the API returned nothing for it.
+    """
+
+    def __init__(
+        self,
+        fetch: Callable[[List[str]], Dict[str, Any]],
+        *,
+        window: float,
+        max_batch: int = 50,
+    ) -> None:
+        self._fetch = fetch
+        self.window = window
+        self.max_batch = max_batch
+        self._pending: Dict[str, List[Future]] = {}
+        self._flushing = False
+        self._next_leader: Optional[Future] = None
+        self._cond = threading.Condition()
+
+    def get(self, item_id: str) -> Optional[Any]:
+        future: Future = Future()
+        with self._cond:
+            self._pending.setdefault(item_id, []).append(future)
+            is_leader = not self._flushing
+            self._flushing = True
+            promoted = False
+            while not is_leader and not promoted and not future.done():
+                self._cond.wait()
+                promoted = self._next_leader is future
+            if promoted:
+                self._next_leader = None
+        if is_leader and self.window > 0:
+            time.sleep(self.window)
+        if is_leader or promoted:
+            # A promoted caller skips the window: its batch queued up during the last fetch.
+            self._flush(item_id)
+        return future.result()
+
+    def _flush(self, item_id: str) -> None:
+        with self._cond:
+            others = [pending_id for pending_id in self._pending if pending_id != item_id]
+            batch_ids = [item_id, *others[: self.max_batch - 1]]
+            waiters = {pending_id: self._pending.pop(pending_id) for pending_id in batch_ids}
+        if len(batch_ids) > 1:
+            logger.debug("Coalesced %s id lookups into one request", len(batch_ids))
+        try:
+            found = self._fetch(batch_ids)
+        except Exception as exc:  # noqa: BLE001 - re-raised in every waiter
+            for futures in waiters.values():
+                for future in futures:
+                    future.set_exception(exc)
+        else:
+            for pending_id, futures in waiters.items():
+                item = found.get(pending_id)
+                for future in futures:
+                    future.set_result(item)
+        with self._cond:
+            if self._pending:
+                self._next_leader = next(iter(self._pending.values()))[0]
+            else:
+                self._flushing = False
+            self._cond.notify_all()
+
+
+__all__ = ["IdBatcher"]
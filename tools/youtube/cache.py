@@ -0,0 +1,220 @@
+"""Response caches for YouTube API lookups, optionally backed by SQLite."""
+
+from __future__ import annotations
+
+import copy
+import json
+import logging
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Hashable, Optional, Tuple
+
+from config.settings import YOUTUBE_CACHE_DB_PATH, YOUTUBE_CACHE_DB_RETENTION_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class SQLiteCacheStore:
+    """
+    Disk tier for `TTLCache` so cached API payloads survive process restarts.
+
+    Rows are keyed by cache namespace and JSON-encoded key, and carry a
+    wall-clock expiry because monotonic time restarts with the process. Values
+    must be JSON-serialisable; tuples come back as lists. Rows that expired more
+    than `retention` seconds ago are pruned when the database is opened. Disk
+    errors are logged and treated as cache misses.
+    """
+
+    def __init__(self, path: str, *, retention: float) -> None:
+        self.path = path
+        self.retention = retention
+        self._conn: Optional[sqlite3.Connection] = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            Path(self.path).parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(
+                self.path, timeout=5, isolation_level=None, check_same_thread=False
+            )
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "namespace TEXT NOT NULL, key TEXT NOT NULL, "
+                "expires_at REAL NOT NULL, value TEXT NOT NULL, "
+                "PRIMARY KEY (namespace, key))"
+            )
+            conn.execute(
+                "DELETE FROM entries WHERE expires_at < ?",
+                (time.time() - self.retention,),
+            )
+            self._conn = conn
+        return self._conn
+
+    def load(self, namespace: str, key: Hashable) -> Optional[Tuple[float, Any]]:
+        """Return `(expires_at, value)` for a stored entry, with a wall-clock expiry."""
+        try:
+            with self._lock:
+                row = self._connect().execute(
+                    "SELECT expires_at, value FROM entries WHERE namespace = ? AND key = ?",
+                    (namespace, json.dumps(key)),
+                ).fetchone()
+            if row is None:
+                return None
+            return row[0], json.loads(row[1])
+        except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+            logger.warning("Failed to read YouTube cache entry from %s: %s", self.path, exc)
+            return None
+
+    def store(self, namespace: str, key: Hashable, expires_at: float, value: Any) -> None:
+        try:
+            encoded = json.dumps(value, separators=(",", ":"))
+            with self._lock:
+                self._connect().execute(
+                    "INSERT OR REPLACE INTO entries (namespace, key, expires_at, value) "
+                    "VALUES (?, ?, ?, ?)",
+                    (namespace, json.dumps(key), expires_at, encoded),
+                )
+        except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+            logger.warning("Failed to write YouTube cache entry to %s: %s", self.path, exc)
+
+    def touch(self, namespace: str, key: Hashable, expires_at: float) -> None:
+        try:
+            with self._lock:
+                self._connect().execute(
+                    "UPDATE entries SET expires_at = ? WHERE namespace = ? AND key = ?",
+                    (expires_at, namespace, json.dumps(key)),
+                )
+        except (sqlite3.Error, OSError, TypeError, ValueError) as exc:
+            logger.warning("Failed to refresh YouTube cache entry in %s: %s", self.path, exc)
+
+    def clear(self, namespace: str) -> None:
+        try:
+            with self._lock:
+                self._connect().execute("DELETE FROM entries WHERE namespace = ?", (namespace,))
+        except (sqlite3.Error, OSError) as exc:
+            logger.warning("Failed to clear YouTube cache namespace %s: %s", namespace, exc)
+
+
+class TTLCache:
+    """
+    Thread-safe LRU cache whose entries expire after a fixed TTL.
+
+    Values are deep-copied on the way in and out so callers can freely mutate
+    the API payloads they receive without corrupting cached entries.
+
+    With `keep_stale=True`, expired entries stay in the LRU (until evicted) so
+    callers can revalidate them, e.g. with an ETag, via `get_stale`/`refresh`.
+
+    With a `store`, every write also goes to disk under `namespace`, and memory
+    misses fall back to the stored entry, so a restarted process starts warm.
+    """
+
+    def __init__(
+        self,
+        *,
+        maxsize: int,
+        ttl: float,
+        keep_stale: bool = False,
+        store: Optional[SQLiteCacheStore] = None,
+        namespace: str = "default",
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.keep_stale = keep_stale
+        self.namespace = namespace
+        self._store = store
+        self._entries: OrderedDict[Hashable, Tuple[float, Any]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def _entry(self, key: Hashable) -> Optional[Tuple[float, Any]]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                return entry
+        if self._store is None or self.maxsize <= 0:
+            return None
+        row = self._store.load(self.namespace, key)
+        if row is None:
+            return None
+        remaining = row[0] - time.time()
+        if remaining <= 0 and not self.keep_stale:
+            return None
+        with self._lock:
+            entry = self._entries.setdefault(key, (time.monotonic() + remaining, row[1]))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return entry
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.monotonic():
+            if not self.keep_stale:
+                with self._lock:
+                    if self._entries.get(key) is entry:
+                        del self._entries[key]
+            return None
+        return copy.deepcopy(value)
+
+    def get_stale(self, key: Hashable) -> Optional[Any]:
+        """Return the entry for `key` even if it has expired."""
+        entry = self._entry(key)
+        if entry is None:
+            return None
+        return copy.deepcopy(entry[1])
+
+    def refresh(self, key: Hashable) -> bool:
+        """Restart the TTL of an existing entry without replacing its value."""
+        if self.ttl <= 0:
+            return False
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            self._entries[key] = (time.monotonic() + self.ttl, entry[1])
+            self._entries.move_to_end(key)
+        if self._store is not None:
+            self._store.touch(self.namespace, key, time.time() + self.ttl)
+        return True
+
+    def set(self, key: Hashable, value: Any) -> None:
+        if self.maxsize <= 0 or self.ttl <= 0:
+            return
+        stored = copy.deepcopy(value)
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, stored)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        if self._store is not None:
+            self._store.store(self.namespace, key, time.time() + self.ttl, stored)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+        if self._store is not None:
+            self._store.clear(self.namespace)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+
+# Shared disk tier for lookups whose payloads stay valid across restarts; None disables it.
+persistent_store: Optional[SQLiteCacheStore] = (
+    SQLiteCacheStore(YOUTUBE_CACHE_DB_PATH, retention=YOUTUBE_CACHE_DB_RETENTION_SECONDS)
+    if YOUTUBE_CACHE_DB_PATH
+    else None
+)
+
+
+__all__ = ["SQLiteCacheStore", "TTLCache", "persistent_store"]
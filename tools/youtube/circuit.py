@@ -0,0 +1,88 @@
+"""Circuit breaker that fails YouTube calls fast while the API is down."""
+
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from typing import Optional
+
+from config.settings import YOUTUBE_CIRCUIT_FAIL_MAX, YOUTUBE_CIRCUIT_RESET_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+class UpstreamUnavailableError(RuntimeError):
+    """Raised instead of calling the API while the circuit is open."""
+
+    def __init__(self, retry_after: float) -> None:
+        self.retry_after = retry_after
+        super().__init__(f"YouTube API unavailable; retry after {retry_after:.0f}s")
+
+
+class CircuitBreaker:
+    """
+    Open after `fail_max` consecutive upstream failures, then fail fast.
+
+    Once `reset_timeout` seconds have passed, calls are let through again: the
+    first success closes the circuit and any failure re-opens it for another
+    cooldown. Only the caller decides what counts as a failure.
+    """
+
+    def __init__(self, *, fail_max: int, reset_timeout: float) -> None:
+        self.fail_max = fail_max
+        self.reset_timeout = reset_timeout
+        self._failures = 0
+        self._opened_at: Optional[float] = None
+        self._lock = threading.Lock()
+
+    @property
+    def is_open(self) -> bool:
+        with self._lock:
+            return self._retry_after(time.monotonic()) > 0
+
+    def _retry_after(self, now: float) -> float:
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - now)
+
+    def before_call(self) -> None:
+        """Raise `UpstreamUnavailableError` while the circuit is open."""
+        if self.fail_max <= 0:
+            return
+        with self._lock:
+            retry_after = self._retry_after(time.monotonic())
+        if retry_after > 0:
+            raise UpstreamUnavailableError(retry_after)
+
+    def record_success(self) -> None:
+        with self._lock:
+            if self._opened_at is not None:
+                logger.info("YouTube API circuit closed")
+            self._failures = 0
+            self._opened_at = None
+
+    def record_failure(self) -> None:
+        if self.fail_max <= 0:
+            return
+        with self._lock:
+            self._failures += 1
+            if self._opened_at is None and self._failures < self.fail_max:
+                return
+            if self._opened_at is None:
+                logger.warning(
+                    "YouTube API circuit opened after %s consecutive failures; "
+                    "failing fast for %.0fs",
+                    self._failures,
+                    self.reset_timeout,
+                )
+            self._opened_at = time.monotonic()
+
+
+upstream_breaker = CircuitBreaker(
+    fail_max=YOUTUBE_CIRCUIT_FAIL_MAX,
+    reset_timeout=YOUTUBE_CIRCUIT_RESET_SECONDS,
+)
+
+
+__all__ = ["CircuitBreaker", "UpstreamUnavailableError", "upstream_breaker"]
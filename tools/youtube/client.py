@@ -2,36 +2,96 @@
 
 from __future__ import annotations
 
+import atexit
 import errno
+import functools
 import logging
+import re
+import threading
 import time
-from typing import Optional
+from collections import Counter
+from typing import Any, Callable, Dict, Optional, Tuple, TypeVar
 from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
 
 from googleapiclient.discovery import build
 from googleapiclient.errors import HttpError
 
-from config.settings import YOUTUBE_API_KEY
+from config.settings import YOUTUBE_API_KEY, YOUTUBE_PREWARM_SERVICE
 from channel_registry import get_channel_registry
+from tools.youtube.circuit import upstream_breaker
+from tools.youtube.quota import consume_quota, throttle_requests
+from tools.youtube.transport import build_http, build_model
 
 logger = logging.getLogger(__name__)
 
+_T = TypeVar("_T")
+
+# Malformed ids still cost quota, so they are rejected before any API call.
+_VIDEO_ID_RE = re.compile(r"[A-Za-z0-9_-]{11}")
+_CHANNEL_ID_RE = re.compile(r"UC[A-Za-z0-9_-]{22}")
+
 _youtube_service = None
+_youtube_service_lock = threading.Lock()
+
+_RESOLVED_CHANNEL_CACHE_MAX_ENTRIES = 1024
+_resolved_channel_ids: Dict[str, str] = {}
+_resolved_channel_ids_lock = threading.Lock()
 
 
 def get_youtube_service():
-    """Create or reuse a YouTube Data API service client."""
+    """
+    Create or reuse a YouTube Data API service client.
+
+    Every YouTube call in the process should go through this shared service so
+    requests ride the same keep-alive connection pool.
+    """
     global _youtube_service  # noqa: PLW0603
-    if _youtube_service is None:
-        _youtube_service = build(
-            "youtube",
-            "v3",
-            developerKey=YOUTUBE_API_KEY,
-            cache_discovery=False,
-        )
+    if _youtube_service is not None:
+        return _youtube_service
+    with _youtube_service_lock:
+        if _youtube_service is None:
+            # static_discovery uses the discovery document bundled with
+            # google-api-python-client, so building never hits the network.
+            _youtube_service = build(
+                "youtube",
+                "v3",
+                developerKey=YOUTUBE_API_KEY,
+                http=build_http(),
+                model=build_model(),
+                cache_discovery=False,
+                static_discovery=True,
+            )
     return _youtube_service
 
 
+def _close_youtube_service() -> None:
+    """Release the pooled keep-alive connections when the process exits."""
+    if _youtube_service is not None:
+        try:
+            _youtube_service.close()
+        except Exception as exc:  # noqa: BLE001
+            logger.debug("Failed to close YouTube service transport: %s", exc)
+
+
+atexit.register(_close_youtube_service)
+
+
+def _prewarm_youtube_service() -> None:
+    """Build the shared service off the request path; failures surface on first use."""
+    try:
+        get_youtube_service()
+    except Exception as exc:  # noqa: BLE001
+        logger.debug("Background YouTube service warm-up failed: %s", exc)
+
+
+if YOUTUBE_PREWARM_SERVICE:
+    threading.Thread(
+        target=_prewarm_youtube_service,
+        name="yt-service-prewarm",
+        daemon=True,
+    ).start()
+
+
 def execute_request(request, *, retries: int = 1, label: str = "request"):
     """
     Execute a Google API request with basic retries.
@@ -40,7 +100,75 @@ def execute_request(request, *, retries: int = 1, label: str = "request"):
     when the local socket pool is momentarily exhausted. We treat that as a transient error
     and retry with a short backoff so the caller gets a graceful response instead of
     bubbling the exception.
+
+    The request's quota cost is charged to the local budget up front; a
+    `QuotaExceededError` is raised without touching the network once it is spent.
+    Likewise `UpstreamUnavailableError` is raised immediately while the circuit
+    breaker is open after repeated 5xx or network failures. Requests are paced
+    to YOUTUBE_MAX_REQUESTS_PER_SECOND, blocking briefly during bursts.
+    """
+    upstream_breaker.before_call()
+    consume_quota(getattr(request, "methodId", None))
+    throttle_requests()
+    return _call_upstream(
+        functools.partial(_execute_with_retries, request, retries=retries, label=label)
+    )
+
+
+def execute_batch(
+    requests: Dict[str, Any],
+    *,
+    service=None,
+    label: str = "batch",
+) -> Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Exception]]]:
+    """
+    Send several API requests in one HTTP round trip via BatchHttpRequest.
+
+    `requests` maps caller-chosen ids to request objects; the result maps the
+    same ids to `(response, exception)` so one failed call doesn't hide the
+    others. Quota and the circuit breaker apply as in `execute_request`.
     """
+    results: Dict[str, Tuple[Optional[Dict[str, Any]], Optional[Exception]]] = {}
+
+    def _collect(request_id, response, exception) -> None:
+        results[request_id] = (response, exception)
+
+    service = service or get_youtube_service()
+    batch = service.new_batch_http_request(callback=_collect)
+    for request_id, request in requests.items():
+        batch.add(request, request_id=request_id)
+
+    upstream_breaker.before_call()
+    method_calls = Counter(getattr(request, "methodId", None) for request in requests.values())
+    for method_id, calls in method_calls.items():
+        consume_quota(method_id, calls=calls)
+    # Each call inside a batch counts against the API's rate limits separately.
+    throttle_requests(len(requests))
+    logger.info("YouTube API request (%s): %s calls in one batch", label, len(requests))
+    _call_upstream(batch.execute)
+    return results
+
+
+def _call_upstream(func: Callable[[], _T]) -> _T:
+    """Run an API call, recording 5xx and network failures on the circuit breaker."""
+    try:
+        result = func()
+    except HttpError as http_err:
+        if getattr(http_err.resp, "status", 0) >= 500:
+            upstream_breaker.record_failure()
+        else:
+            upstream_breaker.record_success()
+        raise
+    except OSError as exc:
+        # EADDRNOTAVAIL is local socket exhaustion, not an upstream outage.
+        if getattr(exc, "errno", None) != errno.EADDRNOTAVAIL:
+            upstream_breaker.record_failure()
+        raise
+    upstream_breaker.record_success()
+    return result
+
+
+def _execute_with_retries(request, *, retries: int, label: str):
     last_exc: Optional[Exception] = None
     attempts = max(0, retries) + 1
     for attempt in range(1, attempts + 1):
@@ -78,6 +206,30 @@ def execute_request(request, *, retries: int = 1, label: str = "request"):
     raise RuntimeError("Failed to execute request for unknown reasons.")
 
 
+def execute_conditional_request(
+    request,
+    *,
+    etag: Optional[str],
+    retries: int = 1,
+    label: str = "request",
+) -> Optional[Dict[str, Any]]:
+    """
+    Execute a request with `If-None-Match: etag` for cache revalidation.
+
+    Returns None when the API answers 304 Not Modified, meaning the cached body
+    is still current; otherwise returns the fresh response like `execute_request`.
+    """
+    if etag:
+        request.headers["If-None-Match"] = etag
+    try:
+        return execute_request(request, retries=retries, label=label)
+    except HttpError as http_err:
+        if etag and getattr(http_err.resp, "status", None) == 304:
+            logger.debug("YouTube API %s not modified since etag %s", label, etag)
+            return None
+        raise
+
+
 def redact_request_uri(request) -> Optional[str]:
     """Return a sanitized request URI without the API key."""
     try:
@@ -103,21 +255,54 @@ def redact_request_uri(request) -> Optional[str]:
         return None
 
 
+def log_api_request(log: logging.Logger, request, label: str) -> None:
+    """Log the sanitized request URI, skipping the redaction work when INFO is disabled."""
+    if not log.isEnabledFor(logging.INFO):
+        return
+    sanitized_uri = redact_request_uri(request)
+    if sanitized_uri:
+        log.info("YouTube API request (%s): %s", label, sanitized_uri)
+
+
+def is_valid_video_id(video_id: Optional[str]) -> bool:
+    """Return True if `video_id` has the shape of a YouTube video ID."""
+    return bool(video_id) and _VIDEO_ID_RE.fullmatch(video_id) is not None
+
+
+def is_valid_channel_id(channel_id: Optional[str]) -> bool:
+    """Return True if `channel_id` has the shape of a canonical (UC...) channel ID."""
+    return bool(channel_id) and _CHANNEL_ID_RE.fullmatch(channel_id) is not None
+
+
 def resolve_channel_identifier(identifier: str) -> Optional[str]:
     """
     Resolve a user-friendly identifier (handle/title/custom URL) to a canonical channel ID.
     Returns None if it cannot be resolved.
+
+    Registry matching is case-insensitive, so successful resolutions to real
+    (UC-prefixed) channel IDs are memoized per process on the lowercased identifier.
+    Misses and synthetic placeholder IDs are not cached so later registry updates apply.
     """
     if not identifier:
         return None
     cleaned = identifier.strip()
-    if cleaned.startswith("UC"):
+    if is_valid_channel_id(cleaned):
         return cleaned
 
+    cache_key = cleaned.lower()
+    cached = _resolved_channel_ids.get(cache_key)
+    if cached:
+        return cached
+
     try:
         registry = get_channel_registry()
         record = registry.resolve(cleaned)
         if record and record.channel_id:
+            if record.channel_id.startswith("UC"):
+                with _resolved_channel_ids_lock:
+                    if len(_resolved_channel_ids) >= _RESOLVED_CHANNEL_CACHE_MAX_ENTRIES:
+                        _resolved_channel_ids.clear()
+                    _resolved_channel_ids[cache_key] = record.channel_id
             return record.channel_id
     except Exception as exc:  # noqa: BLE001
         logger.warning("Failed to resolve channel identifier %s via registry: %s", identifier, exc)
@@ -165,19 +350,14 @@ def resolve_uploads_playlist_id(
             part="contentDetails",
             id=channel_id,
             maxResults=1,
+            fields="items/contentDetails/relatedPlaylists/uploads",
         )
-        sanitized_uri = redact_request_uri(request)
-        if sanitized_uri:
-            logger.info("YouTube API request (uploads playlist lookup): %s", sanitized_uri)
+        log_api_request(logger, request, "uploads playlist lookup")
         response = execute_request(request, retries=retries, label="uploads playlist lookup")
-        items = response.get("items", [])
+        items = response.get("items") or ()
         if items:
-            playlist_id = (
-                items[0]
-                .get("contentDetails", {})
-                .get("relatedPlaylists", {})
-                .get("uploads")
-            )
+            content_details = items[0].get("contentDetails") or {}
+            playlist_id = (content_details.get("relatedPlaylists") or {}).get("uploads")
     except HttpError as http_err:
         logger.warning(
             "YouTube API error resolving uploads playlist for %s: %s", channel_id, http_err
@@ -207,7 +387,12 @@ def resolve_uploads_playlist_id(
 
 __all__ = [
     "get_youtube_service",
+    "execute_batch",
+    "execute_conditional_request",
     "execute_request",
+    "is_valid_channel_id",
+    "is_valid_video_id",
+    "log_api_request",
     "redact_request_uri",
     "resolve_channel_identifier",
     "resolve_uploads_playlist_id",
@@ -3,26 +3,75 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from googleapiclient.errors import HttpError
 from pydantic import BaseModel, Field
 
 from config.settings import (
+    YOUTUBE_CACHE_MAX_ENTRIES,
+    YOUTUBE_COMMENT_INGEST_BACKGROUND,
+    YOUTUBE_COMMENTS_CACHE_TTL_SECONDS,
     YOUTUBE_DEFAULT_COMMENT_MAX_RESULTS,
+    YOUTUBE_MAX_COMMENT_RESULTS,
 )
 from memory import get_file_search_service
-from tools.youtube.client import execute_request, get_youtube_service, redact_request_uri
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking_coalesced, submit_blocking
+from tools.youtube.cache import TTLCache
+from tools.youtube.circuit import UpstreamUnavailableError
+from tools.youtube.client import (
+    execute_request,
+    get_youtube_service,
+    is_valid_video_id,
+    log_api_request,
+)
+from tools.youtube.quota import QuotaExceededError
 
 logger = logging.getLogger(__name__)
 
+_COMMENTS_PER_PAGE = 100
+_COMMENT_FIELDS = (
+    "nextPageToken,items(id,snippet(totalReplyCount,topLevelComment/snippet("
+    "authorDisplayName,textDisplay,textOriginal,likeCount,publishedAt)))"
+)
+
+_comments_cache = TTLCache(
+    maxsize=YOUTUBE_CACHE_MAX_ENTRIES,
+    ttl=YOUTUBE_COMMENTS_CACHE_TTL_SECONDS,
+)
+
+
+def comment_threads_request(service, video_id: str, max_results: int):
+    """Build one field-masked commentThreads.list page request, most relevant first."""
+    return service.commentThreads().list(
+        part="snippet",
+        videoId=video_id,
+        maxResults=max_results,
+        order="relevance",
+        textFormat="plainText",
+        fields=_COMMENT_FIELDS,
+    )
+
+
+def cached_comments(video_id: str, max_results: int) -> Optional[List[Dict[str, Any]]]:
+    """Return cached comment threads for a video and result limit, or None on a miss."""
+    return _comments_cache.get((video_id, max_results))
+
+
+def store_comments(video_id: str, max_results: int, items: List[Dict[str, Any]]) -> None:
+    _comments_cache.set((video_id, max_results), items)
+
 
 class VideoCommentsInput(BaseModel):
     video_id: str = Field(..., description="The ID of the YouTube video.")
     max_results: int = Field(
         YOUTUBE_DEFAULT_COMMENT_MAX_RESULTS,
-        description="Number of comments to fetch (default 100).",
+        description=(
+            "Number of comments to fetch (default 100). Values above 100 are fetched "
+            f"in pages of 100, up to {YOUTUBE_MAX_COMMENT_RESULTS}."
+        ),
     )
     file_search_store_name: Optional[str] = Field(
         default=None,
@@ -38,13 +87,13 @@ class VideoCommentsInput(BaseModel):
     )
 
 
-class GetVideoCommentsTool(BaseTool):
-    """Tool to get top comments from a video. COST: 1 quota unit."""
+class GetVideoCommentsTool(DeclarationCacheMixin, BaseTool):
+    """Tool to get top comments from a video. COST: 1 quota unit per 100 comments."""
 
     NAME = "get_video_comments"
     DESCRIPTION = (
-        "Fetches top-level comments (max 100 by default) for a video. "
-        "This call costs approximately 1 quota unit."
+        "Fetches top-level comments (100 by default) for a video. "
+        "This call costs approximately 1 quota unit per 100 comments."
     )
 
     def __init__(self) -> None:
@@ -57,16 +106,9 @@ class GetVideoCommentsTool(BaseTool):
     def args_schema(self) -> type[VideoCommentsInput]:
         return VideoCommentsInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
+        return await run_blocking_coalesced(
+            self,
             video_id=args["video_id"],
             max_results=args.get("max_results", YOUTUBE_DEFAULT_COMMENT_MAX_RESULTS),
             file_search_store_name=args.get("file_search_store_name"),
@@ -82,38 +124,57 @@ class GetVideoCommentsTool(BaseTool):
         video_title: Optional[str] = None,
         channel_id: Optional[str] = None,
     ) -> Dict[str, Any]:
+        if not is_valid_video_id(video_id):
+            return {"video_id": video_id, "error": "Invalid video ID."}
         try:
-            max_results = max(1, min(100, max_results))
-            service = get_youtube_service()
-            request = service.commentThreads().list(
-                part="snippet",
-                videoId=video_id,
-                maxResults=max_results,
-                order="relevance",
-                textFormat="plainText",
-            )
-            sanitized_uri = redact_request_uri(request)
-            if sanitized_uri:
-                logger.info("YouTube API request (comments): %s", sanitized_uri)
-            response = execute_request(request, retries=2, label="comments")
-            items: List[Dict[str, Any]] = response.get("items", [])
+            max_results = max(1, min(YOUTUBE_MAX_COMMENT_RESULTS, max_results))
+            items: Optional[List[Dict[str, Any]]] = cached_comments(video_id, max_results)
+            if items is None:
+                items = list(
+                    self._iter_comment_pages(get_youtube_service(), video_id, max_results)
+                )
+                store_comments(video_id, max_results, items)
             payload: Dict[str, Any] = {
                 "video_id": video_id,
                 "comments": items,
             }
             if file_search_store_name and items:
-                ingestion = self._ingest_comments_into_file_search(
-                    store_name=file_search_store_name,
-                    video_id=video_id,
-                    channel_id=channel_id,
-                    video_title=video_title,
-                    comments=items,
-                )
-                if ingestion:
-                    payload["file_search_document"] = ingestion
+                ingest_kwargs = {
+                    "store_name": file_search_store_name,
+                    "video_id": video_id,
+                    "channel_id": channel_id,
+                    "video_title": video_title,
+                    "comments": items,
+                }
+                if YOUTUBE_COMMENT_INGEST_BACKGROUND:
+                    # The upload is a second slow round trip the agent does not
+                    # need to wait for; failures are logged by the ingest helper.
+                    submit_blocking(self._ingest_comments_into_file_search, **ingest_kwargs)
+                    payload["file_search_document"] = {
+                        "status": "pending",
+                        "store_name": file_search_store_name,
+                    }
+                else:
+                    ingestion = self._ingest_comments_into_file_search(**ingest_kwargs)
+                    if ingestion:
+                        payload["file_search_document"] = ingestion
             return payload
+        except QuotaExceededError as quota_err:
+            return {
+                "video_id": video_id,
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "video_id": video_id,
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
         except HttpError as http_err:
-            logger.exception("YouTube API error when fetching comments for %s", video_id)
+            logger.warning(
+                "YouTube API error when fetching comments for %s: %s", video_id, http_err
+            )
             return {
                 "video_id": video_id,
                 "error": f"YouTube API error: {http_err}",
@@ -125,6 +186,31 @@ class GetVideoCommentsTool(BaseTool):
                 "error": f"Unexpected error: {exc}",
             }
 
+    def _iter_comment_pages(
+        self,
+        service,
+        video_id: str,
+        limit: int,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Yield up to `limit` comment threads, following nextPageToken.
+
+        Pages are requested through the shared service, so they reuse its
+        keep-alive connection, and each page is charged to the quota budget by
+        `execute_request`.
+        """
+        request = comment_threads_request(service, video_id, min(_COMMENTS_PER_PAGE, limit))
+        fetched = 0
+        while request is not None:
+            log_api_request(logger, request, "comments")
+            response = execute_request(request, retries=2, label="comments")
+            for item in response.get("items", []):
+                yield item
+                fetched += 1
+                if fetched >= limit:
+                    return
+            request = service.commentThreads().list_next(request, response)
+
     def _ingest_comments_into_file_search(
         self,
         *,
@@ -135,17 +221,19 @@ class GetVideoCommentsTool(BaseTool):
         comments: List[Dict[str, Any]],
     ) -> Optional[Dict[str, Any]]:
         try:
-            snippets: List[str] = []
-            for item in comments:
-                try:
-                    comment_snippet = item["snippet"]["topLevelComment"]["snippet"]
-                except KeyError:
-                    continue
-                author = comment_snippet.get("authorDisplayName", "Unknown")
-                text = comment_snippet.get("textDisplay") or comment_snippet.get("textOriginal")
-                if not text:
-                    continue
-                snippets.append(f"{author}: {text}")
+            snippets = [
+                f"{comment_snippet.get('authorDisplayName', 'Unknown')}: {text}"
+                for item in comments
+                if (
+                    comment_snippet := (
+                        ((item.get("snippet") or {}).get("topLevelComment") or {}).get("snippet")
+                    )
+                )
+                and (
+                    text := comment_snippet.get("textDisplay")
+                    or comment_snippet.get("textOriginal")
+                )
+            ]
             if not snippets:
                 return None
             service = get_file_search_service()
@@ -172,4 +260,10 @@ class GetVideoCommentsTool(BaseTool):
             return None
 
 
-__all__ = ["VideoCommentsInput", "GetVideoCommentsTool"]
+__all__ = [
+    "VideoCommentsInput",
+    "GetVideoCommentsTool",
+    "cached_comments",
+    "comment_threads_request",
+    "store_comments",
+]
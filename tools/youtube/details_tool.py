@@ -3,18 +3,176 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, List, Optional
+import threading
+from typing import Any, Dict, List, Optional, Tuple
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from googleapiclient.errors import HttpError
 from pydantic import BaseModel, Field
 
-from config.settings import YOUTUBE_DEFAULT_MAX_RESULTS
-from tools.youtube.client import execute_request, get_youtube_service, redact_request_uri
+from config.settings import (
+    YOUTUBE_BATCH_WINDOW_SECONDS,
+    YOUTUBE_CACHE_MAX_ENTRIES,
+    YOUTUBE_CHANNEL_DETAILS_CACHE_TTL_SECONDS,
+    YOUTUBE_DEFAULT_MAX_RESULTS,
+    YOUTUBE_VIDEO_DETAILS_CACHE_TTL_SECONDS,
+)
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking_coalesced
+from tools.youtube.batching import IdBatcher
+from tools.youtube.cache import TTLCache, persistent_store
+from tools.youtube.circuit import UpstreamUnavailableError
+from tools.youtube.client import (
+    execute_conditional_request,
+    execute_request,
+    get_youtube_service,
+    is_valid_channel_id,
+    is_valid_video_id,
+    log_api_request,
+)
+from tools.youtube.quota import QuotaExceededError
 from tools.youtube.time_utils import parse_iso8601_duration
 
 logger = logging.getLogger(__name__)
 
+# Entries are (etag, items); expired ones are kept so they can be revalidated
+# with If-None-Match instead of re-downloading unchanged resources. Both are
+# persisted, so a restart revalidates instead of refetching.
+_channel_details_cache = TTLCache(
+    maxsize=YOUTUBE_CACHE_MAX_ENTRIES,
+    ttl=YOUTUBE_CHANNEL_DETAILS_CACHE_TTL_SECONDS,
+    keep_stale=True,
+    store=persistent_store,
+    namespace="channel_details",
+)
+_video_details_cache = TTLCache(
+    maxsize=YOUTUBE_CACHE_MAX_ENTRIES,
+    ttl=YOUTUBE_VIDEO_DETAILS_CACHE_TTL_SECONDS,
+    keep_stale=True,
+    store=persistent_store,
+    namespace="video_details",
+)
+
+_VIDEO_DETAILS_PARTS = "snippet,statistics,contentDetails"
+_VIDEO_DETAILS_FIELDS = (
+    "etag,items(id,"
+    "snippet(publishedAt,channelId,channelTitle,title,description,tags,categoryId,"
+    "defaultAudioLanguage,liveBroadcastContent),"
+    "statistics,"
+    "contentDetails(duration,definition,caption))"
+)
+# channels.list `part` is caller-controlled, so a fixed fields mask can't be used;
+# these bulky or LLM-irrelevant keys are dropped from the response instead.
+_CHANNEL_NOISE_KEYS = ("etag", "kind")
+_CHANNEL_SNIPPET_NOISE_KEYS = ("thumbnails", "localized")
+
+
+def _strip_channel_item(item: Dict[str, Any]) -> Dict[str, Any]:
+    for key in _CHANNEL_NOISE_KEYS:
+        item.pop(key, None)
+    snippet = item.get("snippet")
+    if snippet:
+        for key in _CHANNEL_SNIPPET_NOISE_KEYS:
+            snippet.pop(key, None)
+    return item
+
+
+def videos_request(video_ids: List[str]):
+    """Build the field-masked videos.list request used for video details."""
+    return get_youtube_service().videos().list(
+        part=_VIDEO_DETAILS_PARTS,
+        id=",".join(video_ids),
+        fields=_VIDEO_DETAILS_FIELDS,
+    )
+
+
+def _fetch_videos_by_id(video_ids: List[str]) -> Dict[str, Tuple[Dict[str, Any], Optional[str]]]:
+    request = videos_request(video_ids)
+    log_api_request(logger, request, "video details")
+    response = execute_request(request, retries=2, label="video details")
+    # A response etag only describes a single video when one id was requested.
+    etag = response.get("etag") if len(video_ids) == 1 else None
+    return {item["id"]: (item, etag) for item in response.get("items", ())}
+
+
+_video_details_batcher = IdBatcher(_fetch_videos_by_id, window=YOUTUBE_BATCH_WINDOW_SECONDS)
+
+_channel_batchers: Dict[str, IdBatcher] = {}
+_channel_batchers_lock = threading.Lock()
+
+
+def _get_channel_batcher(part: str) -> IdBatcher:
+    """Return the batcher for single-id channels.list lookups with this `part`."""
+    with _channel_batchers_lock:
+        batcher = _channel_batchers.get(part)
+        if batcher is None:
+
+            def _fetch_channels_by_id(
+                channel_ids: List[str],
+            ) -> Dict[str, Tuple[Dict[str, Any], Optional[str]]]:
+                request = get_youtube_service().channels().list(
+                    part=part,
+                    id=",".join(channel_ids),
+                    maxResults=len(channel_ids),
+                )
+                log_api_request(logger, request, "channel details")
+                response = execute_request(request, retries=2, label="channel details")
+                etag = response.get("etag") if len(channel_ids) == 1 else None
+                return {
+                    item["id"]: (_strip_channel_item(item), etag)
+                    for item in response.get("items", ())
+                }
+
+            batcher = IdBatcher(_fetch_channels_by_id, window=YOUTUBE_BATCH_WINDOW_SECONDS)
+            _channel_batchers[part] = batcher
+        return batcher
+
+
+def cached_video_items(video_id: str) -> Optional[List[Dict[str, Any]]]:
+    """Return unexpired videos.list items for one id, or None on a cache miss."""
+    cached = _video_details_cache.get(video_id)
+    return cached[1] if cached is not None else None
+
+
+def store_video_response(video_id: str, response: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Cache a single-id videos.list response fetched outside this module; return its items."""
+    items = response.get("items", [])
+    if items:
+        _video_details_cache.set(video_id, (response.get("etag"), items))
+    return items
+
+
+def load_video_items(video_id: str) -> List[Dict[str, Any]]:
+    """Return videos.list items for one id from the cache, an ETag revalidation or the batcher."""
+    cached = cached_video_items(video_id)
+    if cached is not None:
+        return cached
+
+    items: List[Dict[str, Any]]
+    etag: Optional[str] = None
+    stale = _video_details_cache.get_stale(video_id)
+    if stale is not None and stale[0]:
+        request = videos_request([video_id])
+        log_api_request(logger, request, "video details revalidation")
+        response = execute_conditional_request(
+            request, etag=stale[0], retries=2, label="video details"
+        )
+        if response is None:
+            _video_details_cache.refresh(video_id)
+            return stale[1]
+        items = response.get("items", [])
+        etag = response.get("etag")
+    else:
+        found = _video_details_batcher.get(video_id)
+        if found:
+            item, etag = found
+            items = [item]
+        else:
+            items = []
+    if items:
+        _video_details_cache.set(video_id, (etag, items))
+    return items
+
 
 class ChannelDetailsInput(BaseModel):
     channel_id: Optional[str] = Field(
@@ -43,7 +201,7 @@ class VideoDetailsInput(BaseModel):
     video_id: str = Field(..., description="The ID of the YouTube video.")
 
 
-class GetChannelDetailsTool(BaseTool):
+class GetChannelDetailsTool(DeclarationCacheMixin, BaseTool):
     """Tool to get detailed channel metadata. COST: 1 quota unit."""
 
     NAME = "get_channel_details"
@@ -62,16 +220,9 @@ class GetChannelDetailsTool(BaseTool):
     def args_schema(self) -> type[ChannelDetailsInput]:
         return ChannelDetailsInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
+        return await run_blocking_coalesced(
+            self,
             channel_id=args.get("channel_id"),
             for_username=args.get("for_username"),
             for_handle=args.get("for_handle"),
@@ -88,7 +239,6 @@ class GetChannelDetailsTool(BaseTool):
         max_results: int = YOUTUBE_DEFAULT_MAX_RESULTS,
     ) -> Dict[str, Any]:
         try:
-            service = get_youtube_service()
             params: Dict[str, Any] = {"part": part}
             filter_count = 0
 
@@ -106,25 +256,74 @@ class GetChannelDetailsTool(BaseTool):
                 return {
                     "error": "Exactly one of channel_id, for_username, or for_handle must be provided."
                 }
+            if channel_id:
+                channel_id = ",".join(value.strip() for value in channel_id.split(","))
+                invalid_ids = [
+                    value for value in channel_id.split(",") if not is_valid_channel_id(value)
+                ]
+                if invalid_ids:
+                    return {"error": f"Invalid channel ID(s): {', '.join(invalid_ids)}"}
+                params["id"] = channel_id
 
             params["maxResults"] = max(0, min(50, max_results))
 
-            request = service.channels().list(**params)
-            sanitized_uri = redact_request_uri(request)
-            if sanitized_uri:
-                logger.info("YouTube API request (channel details): %s", sanitized_uri)
-            response = execute_request(request, retries=2, label="channel details")
-            items: List[Dict[str, Any]] = response.get("items", [])
+            cache_key = tuple(sorted(params.items()))
+            cached = _channel_details_cache.get(cache_key)
+            if cached is not None:
+                return {"channels": cached[1]}
+
+            service = get_youtube_service()
+
+            items: List[Dict[str, Any]]
+            etag: Optional[str] = None
+            stale = _channel_details_cache.get_stale(cache_key)
+            if stale is not None and stale[0]:
+                request = service.channels().list(**params)
+                log_api_request(logger, request, "channel details revalidation")
+                response = execute_conditional_request(
+                    request, etag=stale[0], retries=2, label="channel details"
+                )
+                if response is None:
+                    _channel_details_cache.refresh(cache_key)
+                    return {"channels": stale[1]}
+                items = [_strip_channel_item(item) for item in response.get("items", ())]
+                etag = response.get("etag")
+            elif channel_id and "," not in channel_id and params["maxResults"] > 0:
+                # Single-id lookups share one channels.list call with concurrent callers.
+                found = _get_channel_batcher(part).get(channel_id)
+                if found:
+                    item, etag = found
+                    items = [item]
+                else:
+                    items = []
+            else:
+                request = service.channels().list(**params)
+                log_api_request(logger, request, "channel details")
+                response = execute_request(request, retries=2, label="channel details")
+                items = [_strip_channel_item(item) for item in response.get("items", ())]
+                etag = response.get("etag")
+            if items:
+                _channel_details_cache.set(cache_key, (etag, items))
             return {"channels": items}
+        except QuotaExceededError as quota_err:
+            return {
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
         except HttpError as http_err:
-            logger.exception("YouTube API error when fetching channel details")
+            logger.warning("YouTube API error when fetching channel details: %s", http_err)
             return {"error": f"YouTube API error: {http_err}"}
         except Exception as exc:  # noqa: BLE001
             logger.exception("Unexpected error when fetching channel details")
             return {"error": f"Unexpected error: {exc}"}
 
 
-class GetVideoDetailsTool(BaseTool):
+class GetVideoDetailsTool(DeclarationCacheMixin, BaseTool):
     """Tool to get detailed video metadata. COST: 1 quota unit."""
 
     NAME = "get_video_details"
@@ -143,29 +342,14 @@ class GetVideoDetailsTool(BaseTool):
     def args_schema(self) -> type[VideoDetailsInput]:
         return VideoDetailsInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(video_id=args["video_id"])
+        return await run_blocking_coalesced(self, video_id=args["video_id"])
 
     def __call__(self, video_id: str) -> Dict[str, Any]:
+        if not is_valid_video_id(video_id):
+            return {"video_id": video_id, "error": "Invalid video ID."}
         try:
-            service = get_youtube_service()
-            request = service.videos().list(
-                part="snippet,statistics,contentDetails",
-                id=video_id,
-            )
-            sanitized_uri = redact_request_uri(request)
-            if sanitized_uri:
-                logger.info("YouTube API request (video details): %s", sanitized_uri)
-            response = execute_request(request, retries=2, label="video details")
-            items: List[Dict[str, Any]] = response.get("items", [])
+            items = load_video_items(video_id)
 
             if not items:
                 return {
@@ -188,8 +372,20 @@ class GetVideoDetailsTool(BaseTool):
                     logger.warning("Failed to parse duration for video %s: %s", video_id, duration_iso)
 
             return result
+        except QuotaExceededError as quota_err:
+            return {
+                "video_id": video_id,
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "video_id": video_id,
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
         except HttpError as http_err:
-            logger.exception("YouTube API error when fetching details for %s", video_id)
+            logger.warning("YouTube API error when fetching details for %s: %s", video_id, http_err)
             return {
                 "video_id": video_id,
                 "error": f"YouTube API error: {http_err}",
@@ -207,4 +403,8 @@ __all__ = [
     "VideoDetailsInput",
     "GetChannelDetailsTool",
     "GetVideoDetailsTool",
+    "cached_video_items",
+    "load_video_items",
+    "store_video_response",
+    "videos_request",
 ]
@@ -1,81 +1,63 @@
 from __future__ import annotations
 
+import heapq
 import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from googleapiclient.errors import HttpError
 from pydantic import BaseModel, Field
 
-from tools.youtube.client import execute_request, get_youtube_service, redact_request_uri
-from tools.youtube.time_utils import parse_iso8601_duration
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking_coalesced
+from tools.youtube.circuit import UpstreamUnavailableError
+from tools.youtube.client import (
+    execute_request,
+    get_youtube_service,
+    is_valid_video_id,
+    log_api_request,
+)
+from tools.youtube.enrichment import (
+    VIDEO_RECORD_FIELDS,
+    VIDEO_RECORD_PARTS,
+    build_video_record,
+    top_by_views,
+)
+from tools.youtube.quota import QuotaExceededError
+from tools.youtube.time_utils import parse_rfc3339
 
 logger = logging.getLogger(__name__)
 
 
-def _parse_rfc3339(timestamp: Optional[str]) -> Optional[datetime]:
-    if not timestamp:
-        return None
-    try:
-        cleaned = timestamp.replace("Z", "+00:00")
-        return datetime.fromisoformat(cleaned).astimezone(timezone.utc)
-    except ValueError:
-        logger.warning("Failed to parse timestamp %s", timestamp)
-        return None
-
-
-def _enrich_video_ids(video_ids: List[str], service, order: str) -> List[Dict[str, Any]]:
+def _enrich_video_ids(
+    video_ids: List[str],
+    service,
+    order: str,
+    limit: Optional[int] = None,
+) -> List[Dict[str, Any]]:
     request = service.videos().list(
-        part="snippet,statistics,contentDetails,topicDetails",
+        part=VIDEO_RECORD_PARTS,
         id=",".join(video_ids),
+        fields=VIDEO_RECORD_FIELDS,
     )
-    sanitized_uri = redact_request_uri(request)
-    if sanitized_uri:
-        logger.info("YouTube API request (video details for enrich): %s", sanitized_uri)
+    log_api_request(logger, request, "video details for enrich")
     response = execute_request(request, retries=2, label="video details enrich")
     items = response.get("items", [])
 
-    enriched: List[Dict[str, Any]] = []
-    for item in items:
-        video_id = item.get("id")
-        merged: Dict[str, Any] = {
-            "video_id": video_id,
-            "statistics": item.get("statistics", {}),
-            "contentDetails": item.get("contentDetails", {}),
-            "topicDetails": item.get("topicDetails", {}),
-            "snippet": item.get("snippet", {}),
-        }
-        view_count_value = (
-            merged.get("statistics", {}).get("viewCount")
-            if isinstance(merged.get("statistics"), dict)
-            else None
-        )
-        try:
-            view_count = int(view_count_value) if view_count_value is not None else None
-        except (TypeError, ValueError):
-            view_count = None
-        merged["view_count"] = view_count
-        merged["publish_date"] = merged.get("snippet", {}).get("publishedAt")
-        duration_iso = merged.get("contentDetails", {}).get("duration")
-        if duration_iso:
-            try:
-                merged["duration_seconds"] = parse_iso8601_duration(duration_iso)
-                merged["duration"] = duration_iso
-            except ValueError:
-                logger.warning("Failed to parse duration for video %s", video_id)
-        tags = merged.get("snippet", {}).get("tags")
-        merged["tags"] = tags or []
-        enriched.append(merged)
+    enriched = [build_video_record(item.get("id"), item) for item in items]
+    limit = len(enriched) if limit is None else limit
 
     if order == "viewCount":
-        enriched.sort(key=lambda item: item.get("view_count") or 0, reverse=True)
-    elif order == "date":
-        enriched.sort(
-            key=lambda item: _parse_rfc3339(item.get("publish_date")) or datetime.min.replace(tzinfo=timezone.utc),
-            reverse=True,
+        return top_by_views(enriched, limit)
+    if order == "date":
+        oldest = datetime.min.replace(tzinfo=timezone.utc)
+        return heapq.nlargest(
+            limit,
+            enriched,
+            key=lambda item: parse_rfc3339(item.get("publish_date")) or oldest,
         )
-    return enriched
+    return enriched[:limit]
 
 
 class EnrichPlaylistVideosInput(BaseModel):
@@ -93,7 +75,7 @@ class EnrichPlaylistVideosInput(BaseModel):
     )
 
 
-class EnrichPlaylistVideosTool(BaseTool):
+class EnrichPlaylistVideosTool(DeclarationCacheMixin, BaseTool):
     """Fetch video details for playlist items and optionally sort locally."""
 
     NAME = "enrich_playlist_videos"
@@ -112,16 +94,9 @@ class EnrichPlaylistVideosTool(BaseTool):
     def args_schema(self) -> type[EnrichPlaylistVideosInput]:
         return EnrichPlaylistVideosInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
+        return await run_blocking_coalesced(
+            self,
             video_ids=args["video_ids"],
             order=args.get("order", "viewCount"),
             max_results=args.get("max_results"),
@@ -137,22 +112,35 @@ class EnrichPlaylistVideosTool(BaseTool):
             ids = [vid for vid in video_ids if vid]
             if not ids:
                 return {"error": "video_ids must be a non-empty list"}
+            invalid_ids = [vid for vid in ids if not is_valid_video_id(vid)]
+            if invalid_ids:
+                return {"error": f"Invalid video ID(s): {', '.join(invalid_ids)}"}
             ids = ids[:50]
-            service = get_youtube_service()
-            enriched_items = _enrich_video_ids(ids, service, order)
+            cap: Optional[int] = None
             if max_results is not None:
                 try:
                     cap = max(1, min(50, int(max_results)))
-                    enriched_items = enriched_items[:cap]
                 except (TypeError, ValueError):
-                    pass
+                    cap = None
+            service = get_youtube_service()
+            enriched_items = _enrich_video_ids(ids, service, order, limit=cap)
             return {
                 "videos": enriched_items,
                 "order": order,
                 "source": "videos.list",
             }
+        except QuotaExceededError as quota_err:
+            return {
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
         except HttpError as http_err:
-            logger.exception("YouTube API error when enriching playlist videos")
+            logger.warning("YouTube API error when enriching playlist videos: %s", http_err)
             return {"error": f"YouTube API error: {http_err}"}
         except Exception as exc:  # noqa: BLE001
             logger.exception("Unexpected error when enriching playlist videos")
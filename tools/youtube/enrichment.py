@@ -0,0 +1,89 @@
+"""Helpers that flatten videos.list resources into the records returned by tools."""
+
+from __future__ import annotations
+
+import heapq
+import logging
+from typing import Any, Dict, List, Optional
+
+from tools.youtube.time_utils import parse_iso8601_duration
+
+logger = logging.getLogger(__name__)
+
+# Partial-response masks (`fields=`) limited to what the records below and the
+# agent actually read; etags, thumbnails and localized blocks are never fetched.
+VIDEO_RECORD_PARTS = "snippet,statistics,contentDetails,topicDetails"
+VIDEO_RECORD_FIELDS = (
+    "items(id,"
+    "snippet(publishedAt,channelId,channelTitle,title,description,tags),"
+    "statistics,"
+    "contentDetails/duration,"
+    "topicDetails/topicCategories)"
+)
+PLAYLIST_ITEM_FIELDS = (
+    "nextPageToken,pageInfo,"
+    "items(snippet(publishedAt,channelId,channelTitle,title,description,resourceId/videoId),"
+    "contentDetails(videoId,videoPublishedAt))"
+)
+
+
+def build_video_record(
+    video_id: Optional[str],
+    detail: Dict[str, Any],
+    *,
+    snippet: Optional[Dict[str, Any]] = None,
+    content_details: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """
+    Merge a videos.list resource into a single flat record in one pass.
+
+    `snippet` and `content_details` are fallbacks from the originating
+    playlistItems/search item, used when no details were fetched for the video.
+    """
+    snippet = detail.get("snippet") or snippet or {}
+    statistics = detail.get("statistics") or {}
+    if detail:
+        content_details = detail.get("contentDetails") or {}
+    else:
+        content_details = content_details or {}
+
+    try:
+        view_count: Optional[int] = int(statistics["viewCount"])
+    except (KeyError, TypeError, ValueError):
+        view_count = None
+
+    record: Dict[str, Any] = {
+        "video_id": video_id,
+        "snippet": snippet,
+        "contentDetails": content_details,
+        "statistics": statistics,
+        "topicDetails": detail.get("topicDetails") or {},
+        "view_count": view_count,
+        "publish_date": snippet.get("publishedAt"),
+        "tags": snippet.get("tags") or [],
+    }
+
+    duration_iso = content_details.get("duration")
+    if duration_iso:
+        try:
+            record["duration_seconds"] = parse_iso8601_duration(duration_iso)
+            record["duration"] = duration_iso
+        except ValueError:
+            logger.warning("Failed to parse duration for video %s", video_id)
+    return record
+
+
+def top_by_views(records: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """Return the `limit` most-viewed records, most-viewed first (ties keep input order)."""
+    view_counts = [record.get("view_count") or 0 for record in records]
+    top_indices = heapq.nlargest(limit, range(len(records)), key=view_counts.__getitem__)
+    return [records[index] for index in top_indices]
+
+
+__all__ = [
+    "PLAYLIST_ITEM_FIELDS",
+    "VIDEO_RECORD_FIELDS",
+    "VIDEO_RECORD_PARTS",
+    "build_video_record",
+    "top_by_views",
+]
@@ -3,18 +3,23 @@ from __future__ import annotations
 import logging
 from typing import Any, Dict, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from googleapiclient.errors import HttpError
 from pydantic import BaseModel, Field
 
 from config.settings import YOUTUBE_DEFAULT_MAX_RESULTS
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking_coalesced
+from tools.youtube.circuit import UpstreamUnavailableError
 from tools.youtube.client import (
     execute_request,
     get_youtube_service,
-    redact_request_uri,
+    log_api_request,
     resolve_channel_identifier,
     resolve_uploads_playlist_id,
 )
+from tools.youtube.enrichment import PLAYLIST_ITEM_FIELDS
+from tools.youtube.quota import QuotaExceededError
 
 logger = logging.getLogger(__name__)
 
@@ -31,7 +36,7 @@ class PlaylistVideosInput(BaseModel):
     )
 
 
-class ListChannelUploadsTool(BaseTool):
+class ListChannelUploadsTool(DeclarationCacheMixin, BaseTool):
     """
     Tool to list uploads via playlistItems. COST: 1 quota unit.
 
@@ -56,16 +61,9 @@ class ListChannelUploadsTool(BaseTool):
     def args_schema(self) -> type[PlaylistVideosInput]:
         return PlaylistVideosInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
+        return await run_blocking_coalesced(
+            self,
             channel_id=args["channel_id"],
             max_results=args.get("max_results", YOUTUBE_DEFAULT_MAX_RESULTS),
             page_token=args.get("page_token"),
@@ -78,6 +76,7 @@ class ListChannelUploadsTool(BaseTool):
         page_token: Optional[str] = None,
     ) -> Dict[str, Any]:
         try:
+            max_results = max(1, min(50, max_results))
             resolved_channel_id = resolve_channel_identifier(channel_id)
             if not resolved_channel_id:
                 return {
@@ -85,7 +84,6 @@ class ListChannelUploadsTool(BaseTool):
                     "error": "Invalid channel identifier. Provide a YouTube channel ID or known handle/title from registry.",
                 }
 
-            max_results = max(1, min(50, max_results))
             service = get_youtube_service()
             playlist_id = resolve_uploads_playlist_id(resolved_channel_id, service=service)
             if not playlist_id:
@@ -99,10 +97,9 @@ class ListChannelUploadsTool(BaseTool):
                 playlistId=playlist_id,
                 maxResults=max_results,
                 pageToken=page_token,
+                fields=PLAYLIST_ITEM_FIELDS,
             )
-            sanitized_uri = redact_request_uri(request)
-            if sanitized_uri:
-                logger.info("YouTube API request (playlist uploads): %s", sanitized_uri)
+            log_api_request(logger, request, "playlist uploads")
             response = execute_request(request, retries=2, label="playlist uploads")
             playlist_items = response.get("items", [])
             return {
@@ -113,9 +110,21 @@ class ListChannelUploadsTool(BaseTool):
                 "page_info": response.get("pageInfo"),
                 "source": "playlistItems",
             }
+        except QuotaExceededError as quota_err:
+            return {
+                "channel_id": resolved_channel_id if "resolved_channel_id" in locals() else channel_id,
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "channel_id": resolved_channel_id if "resolved_channel_id" in locals() else channel_id,
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
         except HttpError as http_err:
-            logger.exception(
-                "YouTube API error when listing uploads for %s", channel_id
+            logger.warning(
+                "YouTube API error when listing uploads for %s: %s", channel_id, http_err
             )
             return {
                 "channel_id": resolved_channel_id if "resolved_channel_id" in locals() else channel_id,
@@ -0,0 +1,154 @@
+"""Client-side YouTube Data API quota budgeting."""
+
+from __future__ import annotations
+
+import logging
+import math
+import threading
+import time
+from typing import Optional
+
+from config.settings import YOUTUBE_DAILY_QUOTA_UNITS, YOUTUBE_MAX_REQUESTS_PER_SECOND
+
+logger = logging.getLogger(__name__)
+
+SECONDS_PER_DAY = 86400
+
+DEFAULT_METHOD_COST = 1
+METHOD_QUOTA_COSTS = {
+    "youtube.search.list": 100,
+}
+
+
+class QuotaExceededError(RuntimeError):
+    """Raised when a request would overdraw the local quota budget."""
+
+    def __init__(self, method_id: Optional[str], cost: int, retry_after: float) -> None:
+        self.method_id = method_id
+        self.cost = cost
+        self.retry_after = retry_after
+        super().__init__(
+            f"YouTube quota budget exhausted for {method_id or 'request'} "
+            f"(cost {cost}); retry after {retry_after:.0f}s"
+        )
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket refilled continuously at `rate` tokens per second.
+
+    The bucket starts full so a freshly started process can spend its burst
+    capacity immediately.
+    """
+
+    def __init__(self, *, capacity: float, rate: float) -> None:
+        self.capacity = capacity
+        self.rate = rate
+        self._tokens = capacity
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self, now: float) -> None:
+        elapsed = now - self._updated_at
+        if elapsed > 0:
+            self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    def try_consume(self, cost: float) -> bool:
+        with self._lock:
+            self._refill(time.monotonic())
+            if self._tokens < cost:
+                return False
+            self._tokens -= cost
+            return True
+
+    def acquire(self, cost: float = 1) -> None:
+        """Block until `cost` tokens are available, then take them."""
+        if cost > self.capacity or self.rate <= 0:
+            raise ValueError(f"Cannot acquire {cost} tokens from this bucket")
+        while True:
+            with self._lock:
+                self._refill(time.monotonic())
+                if self._tokens >= cost:
+                    self._tokens -= cost
+                    return
+                wait = (cost - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def retry_after(self, cost: float) -> float:
+        """Seconds until `cost` tokens are available (inf if it never fits)."""
+        with self._lock:
+            self._refill(time.monotonic())
+            missing = cost - self._tokens
+            if missing <= 0:
+                return 0.0
+            if cost > self.capacity or self.rate <= 0:
+                return math.inf
+            return missing / self.rate
+
+    @property
+    def tokens(self) -> float:
+        with self._lock:
+            self._refill(time.monotonic())
+            return self._tokens
+
+
+_quota_bucket: Optional[TokenBucket] = (
+    TokenBucket(
+        capacity=YOUTUBE_DAILY_QUOTA_UNITS,
+        rate=YOUTUBE_DAILY_QUOTA_UNITS / SECONDS_PER_DAY,
+    )
+    if YOUTUBE_DAILY_QUOTA_UNITS > 0
+    else None
+)
+
+# Short-term pacing so bursts of tool calls don't trip the API's rate limits (429s).
+_request_bucket: Optional[TokenBucket] = (
+    TokenBucket(
+        capacity=max(1.0, YOUTUBE_MAX_REQUESTS_PER_SECOND),
+        rate=YOUTUBE_MAX_REQUESTS_PER_SECOND,
+    )
+    if YOUTUBE_MAX_REQUESTS_PER_SECOND > 0
+    else None
+)
+
+
+def consume_quota(method_id: Optional[str], *, calls: int = 1) -> None:
+    """
+    Charge the documented quota cost of `calls` requests to `method_id`.
+
+    Raises `QuotaExceededError` instead of letting the request reach the API
+    when the daily budget is spent. Budgeting is disabled when
+    YOUTUBE_DAILY_QUOTA_UNITS is 0.
+    """
+    if _quota_bucket is None:
+        return
+    cost = METHOD_QUOTA_COSTS.get(method_id or "", DEFAULT_METHOD_COST) * calls
+    if _quota_bucket.try_consume(cost):
+        return
+    retry_after = _quota_bucket.retry_after(cost)
+    logger.warning(
+        "YouTube quota budget exhausted for %s (cost %s, retry after %.0fs)",
+        method_id,
+        cost,
+        retry_after,
+    )
+    raise QuotaExceededError(method_id, cost, retry_after)
+
+
+def throttle_requests(calls: int = 1) -> None:
+    """Wait until `calls` more requests fit within YOUTUBE_MAX_REQUESTS_PER_SECOND."""
+    if _request_bucket is None:
+        return
+    for _ in range(calls):
+        _request_bucket.acquire()
+
+
+__all__ = [
+    "DEFAULT_METHOD_COST",
+    "METHOD_QUOTA_COSTS",
+    "QuotaExceededError",
+    "TokenBucket",
+    "consume_quota",
+    "throttle_requests",
+]
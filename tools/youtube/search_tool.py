@@ -3,37 +3,63 @@
 from __future__ import annotations
 
 import logging
-from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from googleapiclient.errors import HttpError
 from pydantic import BaseModel, Field
 
 from config.settings import (
+    YOUTUBE_CACHE_MAX_ENTRIES,
     YOUTUBE_DEFAULT_MAX_RESULTS,
+    YOUTUBE_PLAYLIST_CACHE_TTL_SECONDS,
+    YOUTUBE_SEARCH_CACHE_TTL_SECONDS,
+    YOUTUBE_VIDEO_DETAILS_CACHE_TTL_SECONDS,
 )
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking_coalesced
+from tools.youtube.cache import TTLCache, persistent_store
+from tools.youtube.circuit import UpstreamUnavailableError
 from tools.youtube.client import (
+    execute_batch,
     execute_request,
     get_youtube_service,
-    redact_request_uri,
+    log_api_request,
     resolve_channel_identifier,
     resolve_uploads_playlist_id,
 )
-from tools.youtube.time_utils import maybe_normalize_timestamp, parse_iso8601_duration
+from tools.youtube.enrichment import (
+    PLAYLIST_ITEM_FIELDS,
+    VIDEO_RECORD_FIELDS,
+    VIDEO_RECORD_PARTS,
+    build_video_record,
+    top_by_views,
+)
+from tools.youtube.quota import QuotaExceededError
+from tools.youtube.time_utils import maybe_normalize_timestamp, parse_rfc3339
 
 logger = logging.getLogger(__name__)
 
+_playlist_items_cache = TTLCache(
+    maxsize=YOUTUBE_CACHE_MAX_ENTRIES,
+    ttl=YOUTUBE_PLAYLIST_CACHE_TTL_SECONDS,
+)
+_search_cache = TTLCache(
+    maxsize=YOUTUBE_CACHE_MAX_ENTRIES,
+    ttl=YOUTUBE_SEARCH_CACHE_TTL_SECONDS,
+)
+# Keyed per video id so overlapping result sets share cached records. Unlike the
+# search.list results above, video metadata is stable enough to persist.
+_video_details_cache = TTLCache(
+    maxsize=YOUTUBE_CACHE_MAX_ENTRIES,
+    ttl=YOUTUBE_VIDEO_DETAILS_CACHE_TTL_SECONDS,
+    store=persistent_store,
+    namespace="search_video_details",
+)
 
-def _parse_rfc3339(timestamp: Optional[str]) -> Optional[datetime]:
-    if not timestamp:
-        return None
-    try:
-        cleaned = timestamp.replace("Z", "+00:00")
-        return datetime.fromisoformat(cleaned).astimezone(timezone.utc)
-    except ValueError:
-        logger.warning("Failed to parse timestamp %s", timestamp)
-        return None
+_VIDEOS_LIST_MAX_IDS = 50
+_SEARCH_ORDERS = frozenset({"date", "rating", "relevance", "title", "videoCount", "viewCount"})
+_SEARCH_FIELDS = "items(id/videoId,snippet(publishedAt,channelId,channelTitle,title,description))"
 
 
 def _collect_playlist_items(
@@ -43,7 +69,18 @@ def _collect_playlist_items(
     max_results: int,
     label: str,
 ) -> List[Dict[str, Any]]:
-    """Paginate playlistItems until we reach max_results or exhaust the feed."""
+    """
+    Paginate playlistItems until we reach max_results or exhaust the feed.
+
+    Results are cached briefly per (playlist_id, max_results) because agents
+    tend to re-read the newest uploads page across follow-up questions.
+    """
+    cache_key = (playlist_id, max_results)
+    cached = _playlist_items_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Playlist items cache hit for %s (%s)", playlist_id, label)
+        return cached
+
     collected: List[Dict[str, Any]] = []
     page_token: Optional[str] = None
 
@@ -54,10 +91,9 @@ def _collect_playlist_items(
             playlistId=playlist_id,
             maxResults=page_size,
             pageToken=page_token,
+            fields=PLAYLIST_ITEM_FIELDS,
         )
-        sanitized_uri = redact_request_uri(request)
-        if sanitized_uri:
-            logger.info("YouTube API request (%s): %s", label, sanitized_uri)
+        log_api_request(logger, request, label)
         response = execute_request(request, retries=2, label=label)
         items = response.get("items", [])
         collected.extend(items)
@@ -65,77 +101,105 @@ def _collect_playlist_items(
         if not page_token:
             break
 
-    return collected[:max_results]
+    collected = collected[:max_results]
+    _playlist_items_cache.set(cache_key, collected)
+    return collected
+
+
+def _search_videos(service, params: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Run search.list (100 quota units), reusing identical recent searches."""
+    cache_key = tuple(sorted(params.items()))
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        logger.debug("Search cache hit for channel %s", params.get("channelId"))
+        return cached
+
+    request = service.search().list(**params)
+    log_api_request(logger, request, "search")
+    response = execute_request(request, retries=2, label="search")
+    items: List[Dict[str, Any]] = response.get("items", [])
+    _search_cache.set(cache_key, items)
+    return items
+
+
+def _execute_video_details_batch(service, id_chunks: List[List[str]]) -> List[Dict[str, Any]]:
+    """Send several videos.list calls in one HTTP round trip via BatchHttpRequest."""
+    requests = {
+        str(index): service.videos().list(
+            part=VIDEO_RECORD_PARTS,
+            id=",".join(chunk),
+            fields=VIDEO_RECORD_FIELDS,
+        )
+        for index, chunk in enumerate(id_chunks)
+    }
+    results = execute_batch(requests, service=service, label="video details batch")
+    items: List[Dict[str, Any]] = []
+    for response, exception in results.values():
+        if exception is not None:
+            raise exception
+        items.extend(response.get("items", ()))
+    return items
 
 
 def _fetch_video_details_map(service, video_ids: List[str]) -> Dict[str, Dict[str, Any]]:
-    if not video_ids:
-        return {}
-    request = service.videos().list(
-        part="snippet,statistics,contentDetails,topicDetails",
-        id=",".join(video_ids),
-    )
-    sanitized_details_uri = redact_request_uri(request)
-    if sanitized_details_uri:
-        logger.info("YouTube API request (video details batch): %s", sanitized_details_uri)
-    details_response = execute_request(request, retries=2, label="video details batch")
-    return {
-        item["id"]: item
-        for item in details_response.get("items", [])
-        if item.get("id")
-    }
+    """Return videos.list records by id, fetching only ids missing from the per-video cache."""
+    details_map: Dict[str, Dict[str, Any]] = {}
+    missing_ids: List[str] = []
+    for video_id in dict.fromkeys(video_ids):
+        cached = _video_details_cache.get(video_id)
+        if cached is not None:
+            details_map[video_id] = cached
+        else:
+            missing_ids.append(video_id)
+    if not missing_ids:
+        return details_map
+
+    id_chunks = [
+        missing_ids[start : start + _VIDEOS_LIST_MAX_IDS]
+        for start in range(0, len(missing_ids), _VIDEOS_LIST_MAX_IDS)
+    ]
+    if len(id_chunks) == 1:
+        request = service.videos().list(
+            part=VIDEO_RECORD_PARTS,
+            id=",".join(missing_ids),
+            fields=VIDEO_RECORD_FIELDS,
+        )
+        log_api_request(logger, request, "video details batch")
+        details_response = execute_request(request, retries=2, label="video details batch")
+        items = details_response.get("items", ())
+    else:
+        items = _execute_video_details_batch(service, id_chunks)
+    # videos.list always returns the id (the resource's primary key) on every item.
+    for item in items:
+        _video_details_cache.set(item["id"], item)
+        details_map[item["id"]] = item
+    return details_map
 
 
 def _enrich_with_details(
     items: List[Dict[str, Any]],
     details_map: Dict[str, Dict[str, Any]],
 ) -> List[Dict[str, Any]]:
-    enriched_items: List[Dict[str, Any]] = []
-    for item in items:
-        content_details = item.get("contentDetails") or {}
-        snippet = item.get("snippet") or {}
-        video_id = content_details.get("videoId") or item.get("id", {}).get("videoId")
-        detail = details_map.get(video_id, {})
-
-        merged = dict(item)
-        merged["video_id"] = video_id
-        if detail:
-            merged["statistics"] = detail.get("statistics", {})
-            merged["contentDetails"] = detail.get("contentDetails", {})
-            merged["topicDetails"] = detail.get("topicDetails", {})
-            if detail.get("snippet"):
-                merged["snippet"] = detail.get("snippet")
-
-        view_count_value = (
-            merged.get("statistics", {}).get("viewCount")
-            if isinstance(merged.get("statistics"), dict)
-            else None
+    """
+    Merge videos.list details into playlist/search items, keeping only consumed fields.
+
+    The enriched records replace the originals inside `items`, which is returned;
+    callers hand over freshly fetched (or cache-copied) lists they do not reuse.
+    """
+    for index, item in enumerate(items):
+        item_content_details = item.get("contentDetails") or {}
+        video_id = (
+            item_content_details.get("videoId")
+            or ((item.get("snippet") or {}).get("resourceId") or {}).get("videoId")
+            or (item.get("id") or {}).get("videoId")
         )
-        try:
-            view_count = int(view_count_value) if view_count_value is not None else None
-        except (TypeError, ValueError):
-            view_count = None
-        merged["view_count"] = view_count
-
-        merged_snippet = merged.get("snippet") or snippet
-        merged["publish_date"] = merged_snippet.get("publishedAt")
-        tags = merged_snippet.get("tags") if isinstance(merged_snippet, dict) else None
-        merged["tags"] = tags or []
-
-        duration_iso = (
-            merged.get("contentDetails", {}).get("duration")
-            if isinstance(merged.get("contentDetails"), dict)
-            else None
+        items[index] = build_video_record(
+            video_id,
+            details_map.get(video_id) or {},
+            snippet=item.get("snippet"),
+            content_details=item_content_details,
         )
-        if duration_iso:
-            try:
-                merged["duration_seconds"] = parse_iso8601_duration(duration_iso)
-                merged["duration"] = duration_iso
-            except ValueError:
-                logger.warning("Failed to parse duration for video %s", video_id)
-
-        enriched_items.append(merged)
-    return enriched_items
+    return items
 
 
 class LatestVideosInput(BaseModel):
@@ -184,13 +248,13 @@ class ChannelVideoSearchInput(BaseModel):
     )
 
 
-class GetLatestVideosTool(BaseTool):
-    """Tool to get the latest videos from a channel. COST: 100 quota units."""
+class GetLatestVideosTool(DeclarationCacheMixin, BaseTool):
+    """Tool to get the latest videos from a channel. COST: ~2 quota units."""
 
     NAME = "get_latest_videos"
     DESCRIPTION = (
-        "Fetches the latest videos (max 5 by default) from a channel. "
-        "WARNING: This call costs 100 quota units, so limit usage."
+        "Fetches the latest videos (max 5 by default) from a channel's uploads playlist, "
+        "enriched with statistics and duration. This call costs approximately 2 quota units."
     )
 
     def __init__(self) -> None:
@@ -203,29 +267,22 @@ class GetLatestVideosTool(BaseTool):
     def args_schema(self) -> type[LatestVideosInput]:
         return LatestVideosInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
+        return await run_blocking_coalesced(
+            self,
             channel_id=args["channel_id"],
             max_results=args.get("max_results", YOUTUBE_DEFAULT_MAX_RESULTS),
         )
 
     def __call__(self, channel_id: str, max_results: int = YOUTUBE_DEFAULT_MAX_RESULTS) -> Dict[str, Any]:
         try:
+            max_results = max(1, min(50, max_results))
             resolved_channel_id = resolve_channel_identifier(channel_id)
             if not resolved_channel_id:
                 return {
                     "channel_id": channel_id,
                     "error": "Invalid channel identifier. Provide a YouTube channel ID or known handle/title from registry.",
                 }
-            max_results = max(1, min(50, max_results))
             service = get_youtube_service()
             playlist_id = resolve_uploads_playlist_id(resolved_channel_id, service=service)
             if not playlist_id:
@@ -241,9 +298,12 @@ class GetLatestVideosTool(BaseTool):
                 label="latest videos",
             )
             video_ids: List[str] = [
-                item.get("contentDetails", {}).get("videoId")
+                video_id
                 for item in items
-                if item.get("contentDetails", {}).get("videoId")
+                if (
+                    video_id := (item.get("contentDetails") or {}).get("videoId")
+                    or ((item.get("snippet") or {}).get("resourceId") or {}).get("videoId")
+                )
             ]
             details_map = _fetch_video_details_map(service, video_ids)
             items = _enrich_with_details(items, details_map)
@@ -251,8 +311,22 @@ class GetLatestVideosTool(BaseTool):
                 "channel_id": resolved_channel_id,
                 "videos": items,
             }
+        except QuotaExceededError as quota_err:
+            return {
+                "channel_id": channel_id,
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "channel_id": channel_id,
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
         except HttpError as http_err:
-            logger.exception("YouTube API error when fetching latest videos for %s", channel_id)
+            logger.warning(
+                "YouTube API error when fetching latest videos for %s: %s", channel_id, http_err
+            )
             return {
                 "channel_id": channel_id,
                 "error": f"YouTube API error: {http_err}",
@@ -265,7 +339,7 @@ class GetLatestVideosTool(BaseTool):
             }
 
 
-class SearchChannelVideosTool(BaseTool):
+class SearchChannelVideosTool(DeclarationCacheMixin, BaseTool):
     """Tool to search channel videos within a timeframe. COST: 100 quota units."""
 
     NAME = "search_channel_videos"
@@ -287,16 +361,9 @@ class SearchChannelVideosTool(BaseTool):
     def args_schema(self) -> type[ChannelVideoSearchInput]:
         return ChannelVideoSearchInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
+        return await run_blocking_coalesced(
+            self,
             channel_id=args["channel_id"],
             q=args.get("q", ""),
             published_after=args["published_after"],
@@ -314,22 +381,38 @@ class SearchChannelVideosTool(BaseTool):
         max_results: int = YOUTUBE_DEFAULT_MAX_RESULTS,
         order: str = "viewCount",
     ) -> Dict[str, Any]:
+        resolved_channel_id = channel_id
         try:
+            if not published_after or not published_before:
+                return {
+                    "channel_id": channel_id,
+                    "error": "published_after and published_before are required (use ISO date or RFC3339).",
+                }
+            if order not in _SEARCH_ORDERS:
+                return {
+                    "channel_id": channel_id,
+                    "error": f"Invalid order {order!r}. Use one of: {', '.join(sorted(_SEARCH_ORDERS))}.",
+                }
+            max_results = max(1, min(50, max_results))
+
             resolved_channel_id = resolve_channel_identifier(channel_id)
             if not resolved_channel_id:
                 return {
                     "channel_id": channel_id,
                     "error": "Invalid channel identifier. Provide a YouTube channel ID or known handle/title from registry.",
                 }
-            if not published_after or not published_before:
-                return {
-                    "channel_id": resolved_channel_id,
-                    "error": "published_after and published_before are required (use ISO date or RFC3339).",
-                }
 
-            max_results = max(1, min(50, max_results))
             normalized_after = maybe_normalize_timestamp(published_after)
             normalized_before = maybe_normalize_timestamp(published_before)
+            after_dt = parse_rfc3339(normalized_after)
+            before_dt = parse_rfc3339(normalized_before)
+            if after_dt and before_dt and after_dt >= before_dt:
+                # search.list would bill 100 units for a guaranteed-empty result.
+                return {
+                    "channel_id": resolved_channel_id,
+                    "videos": [],
+                    "error": "published_after must be earlier than published_before.",
+                }
             service = get_youtube_service()
 
             search_max_results = (
@@ -342,46 +425,63 @@ class SearchChannelVideosTool(BaseTool):
                 "maxResults": search_max_results,
                 "order": order,
                 "type": "video",
+                "fields": _SEARCH_FIELDS,
             }
             if normalized_after:
                 params["publishedAfter"] = normalized_after
             if normalized_before:
                 params["publishedBefore"] = normalized_before
 
-            logger.info("YouTube search request params: %s", {k: v for k, v in params.items() if k != "key"})
-            request = service.search().list(**params)
-            sanitized_uri = redact_request_uri(request)
-            if sanitized_uri:
-                logger.info("YouTube API request (search): %s", sanitized_uri)
-            response = execute_request(request, retries=2, label="search")
-            items: List[Dict[str, Any]] = response.get("items", [])
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "YouTube search request params: %s",
+                    {k: v for k, v in params.items() if k != "key"},
+                )
+            items = _search_videos(service, params)
             video_ids = [
-                item.get("id", {}).get("videoId")
+                video_id
                 for item in items
-                if item.get("id", {}).get("videoId")
+                if (video_id := (item.get("id") or {}).get("videoId"))
             ]
 
             details_map: Dict[str, Dict[str, Any]] = {}
+            # Search results are still returned without details, flagged so the
+            # agent knows view counts, tags and durations are missing.
+            details_error: Optional[str] = None
+            details_retry_after: Optional[float] = None
 
             if video_ids:
                 try:
                     details_map = _fetch_video_details_map(service, video_ids)
-                except HttpError:
-                    logger.exception(
-                        "YouTube API error when fetching video details for %s", channel_id
+                except QuotaExceededError as quota_err:
+                    logger.warning("Skipping video details for %s: %s", channel_id, quota_err)
+                    details_error = "YouTube quota budget exhausted."
+                    details_retry_after = quota_err.retry_after
+                except UpstreamUnavailableError as upstream_err:
+                    logger.warning("Skipping video details for %s: %s", channel_id, upstream_err)
+                    details_error = "YouTube API temporarily unavailable."
+                    details_retry_after = upstream_err.retry_after
+                except HttpError as http_err:
+                    logger.warning(
+                        "YouTube API error when fetching video details for %s: %s",
+                        channel_id,
+                        http_err,
                     )
-                except Exception:  # noqa: BLE001
+                    details_error = f"YouTube API error: {http_err}"
+                except Exception as exc:  # noqa: BLE001
                     logger.exception(
                         "Unexpected error when fetching video details for %s", channel_id
                     )
+                    details_error = f"Unexpected error: {exc}"
 
             enriched_items = _enrich_with_details(items, details_map)
 
             if order == "viewCount":
-                enriched_items.sort(key=lambda item: item.get("view_count") or 0, reverse=True)
-            enriched_items = enriched_items[:max_results]
+                enriched_items = top_by_views(enriched_items, max_results)
+            else:
+                enriched_items = enriched_items[:max_results]
 
-            return {
+            payload: Dict[str, Any] = {
                 "channel_id": resolved_channel_id,
                 "published_after": params.get("publishedAfter"),
                 "published_before": params.get("publishedBefore"),
@@ -389,9 +489,26 @@ class SearchChannelVideosTool(BaseTool):
                 "videos": enriched_items,
                 "source": "search.list",
             }
+            if details_error:
+                payload["details_error"] = details_error
+                if details_retry_after is not None:
+                    payload["retry_after"] = details_retry_after
+            return payload
+        except QuotaExceededError as quota_err:
+            return {
+                "channel_id": resolved_channel_id,
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "channel_id": resolved_channel_id,
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
         except HttpError as http_err:
-            logger.exception(
-                "YouTube API error when searching videos for %s", channel_id
+            logger.warning(
+                "YouTube API error when searching videos for %s: %s", channel_id, http_err
             )
             return {
                 "channel_id": resolved_channel_id,
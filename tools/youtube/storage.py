@@ -2,11 +2,11 @@
 
 from __future__ import annotations
 
+import io
 import logging
-import os
-import tempfile
 import time
-from typing import Optional
+from concurrent.futures import ThreadPoolExecutor
+from typing import List, Sequence, Tuple, Union
 
 from google import genai
 
@@ -14,8 +14,11 @@ logger = logging.getLogger(__name__)
 
 _genai_client = None
 
-FILE_POLL_INTERVAL_SECONDS = 1.0
+FILE_POLL_INITIAL_INTERVAL_SECONDS = 0.1
+FILE_POLL_MAX_INTERVAL_SECONDS = 2.0
+FILE_POLL_BACKOFF_FACTOR = 1.5
 FILE_POLL_TIMEOUT_SECONDS = 120.0
+BULK_UPLOAD_MAX_WORKERS = 8
 
 
 def get_genai_client():
@@ -27,11 +30,21 @@ def get_genai_client():
 
 
 def wait_for_file_active(client: genai.Client, *, name: str) -> str:
-    """Poll a Gemini file until it becomes ACTIVE or times out."""
-    deadline = time.time() + FILE_POLL_TIMEOUT_SECONDS
+    """
+    Poll a Gemini file until it becomes ACTIVE or times out.
+
+    Polling starts fast (small transcripts are usually ready within a few hundred
+    milliseconds) and backs off exponentially so slow files are not hammered.
+    """
+    deadline = time.monotonic() + FILE_POLL_TIMEOUT_SECONDS
+    interval = FILE_POLL_INITIAL_INTERVAL_SECONDS
     current = client.files.get(name=name)
-    while current.state not in {"ACTIVE", "FAILED"} and time.time() < deadline:
-        time.sleep(FILE_POLL_INTERVAL_SECONDS)
+    while current.state not in {"ACTIVE", "FAILED"}:
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        time.sleep(min(interval, remaining))
+        interval = min(interval * FILE_POLL_BACKOFF_FACTOR, FILE_POLL_MAX_INTERVAL_SECONDS)
         current = client.files.get(name=name)
     if current.state != "ACTIVE":
         raise RuntimeError(f"File upload did not become ACTIVE (state={current.state})")
@@ -39,33 +52,53 @@ def wait_for_file_active(client: genai.Client, *, name: str) -> str:
 
 
 def upload_text_to_gemini_file(*, text: str, display_name: str) -> str:
-    """Upload text to Gemini Files and return the file URI."""
+    """Upload text to Gemini Files straight from memory and return the file URI."""
     client = get_genai_client()
-    temp_path: Optional[str] = None
-    try:
-        with tempfile.NamedTemporaryFile(
-            mode="w",
-            suffix=".txt",
-            delete=False,
-            encoding="utf-8",
-        ) as tmp:
-            tmp.write(text)
-            tmp.flush()
-            temp_path = tmp.name
-        upload = client.files.upload(file=temp_path)
-        return wait_for_file_active(client, name=upload.name)
-    finally:
-        if temp_path and os.path.exists(temp_path):
-            try:
-                os.remove(temp_path)
-            except OSError:
-                logger.debug("Temporary transcript file already cleaned up: %s", temp_path)
+    upload = client.files.upload(
+        file=io.BytesIO(text.encode("utf-8")),
+        config={"mime_type": "text/plain", "display_name": display_name},
+    )
+    return wait_for_file_active(client, name=upload.name)
+
+
+def bulk_upload_texts_to_gemini_files(
+    items: Sequence[Tuple[str, str]],
+    *,
+    max_workers: int = BULK_UPLOAD_MAX_WORKERS,
+) -> List[Union[str, Exception]]:
+    """
+    Upload several `(text, display_name)` pairs concurrently.
+
+    Each upload spends most of its time waiting on the network and on the
+    ACTIVE poll, so running them in a thread pool makes N uploads take roughly
+    as long as the slowest one. Returns file URIs in input order; a failed upload
+    yields its exception instead of aborting the rest.
+    """
+    if not items:
+        return []
+    # Create the shared client up front so workers don't race to build it.
+    get_genai_client()
+
+    def _upload(item: Tuple[str, str]) -> Union[str, Exception]:
+        text, display_name = item
+        try:
+            return upload_text_to_gemini_file(text=text, display_name=display_name)
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Bulk upload failed for %s: %s", display_name, exc)
+            return exc
+
+    with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(items)))) as pool:
+        return list(pool.map(_upload, items))
 
 
 __all__ = [
+    "bulk_upload_texts_to_gemini_files",
     "get_genai_client",
     "upload_text_to_gemini_file",
     "wait_for_file_active",
-    "FILE_POLL_INTERVAL_SECONDS",
+    "FILE_POLL_INITIAL_INTERVAL_SECONDS",
+    "FILE_POLL_MAX_INTERVAL_SECONDS",
+    "FILE_POLL_BACKOFF_FACTOR",
     "FILE_POLL_TIMEOUT_SECONDS",
+    "BULK_UPLOAD_MAX_WORKERS",
 ]
@@ -2,10 +2,29 @@
 
 from __future__ import annotations
 
+import logging
 import re
 from datetime import datetime, timezone
+from functools import lru_cache
 from typing import Optional
 
+logger = logging.getLogger(__name__)
+
+_DATE_ONLY_RE = re.compile(r"\d{4}-\d{2}-\d{2}")
+
+
+def _is_canonical_rfc3339(value: str) -> bool:
+    """Return True for the canonical `YYYY-MM-DDTHH:MM:SSZ` shape."""
+    return (
+        len(value) == 20
+        and value[19] == "Z"
+        and value[4] == "-"
+        and value[7] == "-"
+        and value[10] == "T"
+        and value[13] == ":"
+        and value[16] == ":"
+    )
+
 
 def format_rfc3339(dt: datetime) -> str:
     """Format datetimes as RFC3339 strings for the YouTube API."""
@@ -20,10 +39,20 @@ def maybe_normalize_timestamp(value: Optional[str]) -> Optional[str]:
     """Attempt to coerce user-provided timestamps into RFC3339 strings."""
     if not value:
         return None
+    # Agents usually pass timestamps that are already normalized; the full
+    # parse below would return them unchanged anyway.
+    if _is_canonical_rfc3339(value):
+        return value
+    return _normalize_timestamp(value)
+
+
+@lru_cache(maxsize=1024)
+def _normalize_timestamp(value: str) -> str:
+    """Parse and re-serialize a non-canonical timestamp; agents tend to repeat them."""
     try:
         cleaned = value.strip()
         # Allow simple date-only strings by appending midnight UTC
-        if re.fullmatch(r"\d{4}-\d{2}-\d{2}", cleaned):
+        if _DATE_ONLY_RE.fullmatch(cleaned):
             cleaned = f"{cleaned}T00:00:00Z"
         if cleaned.endswith("Z"):
             cleaned = cleaned[:-1] + "+00:00"
@@ -33,22 +62,68 @@ def maybe_normalize_timestamp(value: Optional[str]) -> Optional[str]:
         return value
 
 
+def parse_rfc3339(timestamp: Optional[str]) -> Optional[datetime]:
+    """Parse RFC3339 timestamps from the API into UTC datetimes."""
+    if not timestamp:
+        return None
+    # Fast path for the canonical API shape, e.g. 2024-08-01T12:34:56Z.
+    if _is_canonical_rfc3339(timestamp):
+        try:
+            return datetime(
+                int(timestamp[0:4]),
+                int(timestamp[5:7]),
+                int(timestamp[8:10]),
+                int(timestamp[11:13]),
+                int(timestamp[14:16]),
+                int(timestamp[17:19]),
+                tzinfo=timezone.utc,
+            )
+        except ValueError:
+            pass
+    try:
+        cleaned = timestamp.replace("Z", "+00:00")
+        return datetime.fromisoformat(cleaned).astimezone(timezone.utc)
+    except ValueError:
+        logger.warning("Failed to parse timestamp %s", timestamp)
+        return None
+
+
 def parse_iso8601_duration(duration_iso: str) -> int:
     """Parse ISO 8601 duration string (e.g., 'PT1H5M10S') to total seconds."""
     if not duration_iso.startswith("PT"):
         raise ValueError(f"Invalid ISO 8601 duration format: {duration_iso}")
 
-    pattern = r"PT(?:(\d+)H)?(?:(\d+)M)?(?:(\d+)S)?"
-    match = re.match(pattern, duration_iso)
+    total = 0
+    value = 0
+    has_digits = False
+    for char in duration_iso[2:]:
+        # ASCII-only digit test; str.isdigit also accepts e.g. superscripts.
+        digit = ord(char) - 48
+        if 0 <= digit < 10:
+            value = value * 10 + digit
+            has_digits = True
+            continue
+        if not has_digits:
+            raise ValueError(f"Invalid ISO 8601 duration format: {duration_iso}")
+        if char == "H":
+            total += value * 3600
+        elif char == "M":
+            total += value * 60
+        elif char == "S":
+            total += value
+        else:
+            raise ValueError(f"Invalid ISO 8601 duration format: {duration_iso}")
+        value = 0
+        has_digits = False
 
-    if not match:
+    if has_digits:
         raise ValueError(f"Invalid ISO 8601 duration format: {duration_iso}")
-
-    hours = int(match.group(1) or 0)
-    minutes = int(match.group(2) or 0)
-    seconds = int(match.group(3) or 0)
-
-    return hours * 3600 + minutes * 60 + seconds
+    return total
 
 
-__all__ = ["format_rfc3339", "maybe_normalize_timestamp", "parse_iso8601_duration"]
+__all__ = [
+    "format_rfc3339",
+    "maybe_normalize_timestamp",
+    "parse_iso8601_duration",
+    "parse_rfc3339",
+]
@@ -3,17 +3,23 @@
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from typing import Any, Dict, List, Optional
 
-from google.adk.tools import BaseTool, _automatic_function_calling_util as tool_utils
+from google.adk.tools import BaseTool
 from pydantic import BaseModel, Field
 
-from tools.youtube.storage import upload_text_to_gemini_file
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking
+from tools.youtube.storage import bulk_upload_texts_to_gemini_files, upload_text_to_gemini_file
 
 logger = logging.getLogger(__name__)
 
+_USAGE_INSTRUCTION_TEMPLATE = "Pass {} to the analysis_tool."
+_SINGLE_USAGE_INSTRUCTION = _USAGE_INSTRUCTION_TEMPLATE.format("this file_uri")
+_BULK_USAGE_INSTRUCTION = _USAGE_INSTRUCTION_TEMPLATE.format("each file_uri")
 
-class UploadTranscriptToGeminiFileInput(BaseModel):
+
+class TranscriptUploadItem(BaseModel):
     video_id: str = Field(..., description="The ID of the YouTube video.")
     transcript_text: str = Field(..., description="Transcript text to store off-chat.")
     video_title: Optional[str] = Field(
@@ -22,13 +28,36 @@ class UploadTranscriptToGeminiFileInput(BaseModel):
     )
 
 
-class UploadTranscriptToGeminiFileTool(BaseTool):
+class UploadTranscriptToGeminiFileInput(BaseModel):
+    video_id: Optional[str] = Field(
+        default=None,
+        description="The ID of the YouTube video (single upload).",
+    )
+    transcript_text: Optional[str] = Field(
+        default=None,
+        description="Transcript text to store off-chat (single upload).",
+    )
+    video_title: Optional[str] = Field(
+        default=None,
+        description="Optional display name for the Gemini file.",
+    )
+    transcripts: Optional[List[TranscriptUploadItem]] = Field(
+        default=None,
+        description=(
+            "Several transcripts to upload in parallel, instead of video_id/transcript_text."
+        ),
+    )
+
+
+class UploadTranscriptToGeminiFileTool(DeclarationCacheMixin, BaseTool):
     """Upload transcript text to Gemini Files and return a file reference."""
 
     NAME = "upload_transcript_to_gemini_file"
     DESCRIPTION = (
         "Uploads raw transcript text to Gemini Files and returns a file_uri. "
-        "Use when a transcript string is available and must be kept out of the chat context."
+        "Use when a transcript string is available and must be kept out of the chat context. "
+        "To store several transcripts, pass them together in `transcripts`; they upload in "
+        "parallel and each gets its own file_uri."
     )
 
     def __init__(self) -> None:
@@ -41,27 +70,30 @@ class UploadTranscriptToGeminiFileTool(BaseTool):
     def args_schema(self) -> type[UploadTranscriptToGeminiFileInput]:
         return UploadTranscriptToGeminiFileInput
 
-    def _get_declaration(self):
-        declaration = tool_utils.build_function_declaration(
-            func=self.args_schema,
-            variant=self._api_variant,
-        )
-        declaration.name = self.NAME
-        return declaration
-
     async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
-        return self(
-            video_id=args["video_id"],
-            transcript_text=args["transcript_text"],
+        return await run_blocking(
+            self,
+            video_id=args.get("video_id"),
+            transcript_text=args.get("transcript_text"),
             video_title=args.get("video_title"),
+            transcripts=args.get("transcripts"),
         )
 
     def __call__(
         self,
-        video_id: str,
-        transcript_text: str,
+        video_id: Optional[str] = None,
+        transcript_text: Optional[str] = None,
         video_title: Optional[str] = None,
+        transcripts: Optional[List[Dict[str, Any]]] = None,
     ) -> Dict[str, Any]:
+        if transcripts:
+            return self._upload_many(transcripts)
+        if not video_id or transcript_text is None:
+            return {
+                "status": "error",
+                "video_id": video_id,
+                "error": "Provide video_id and transcript_text, or a transcripts list.",
+            }
         try:
             display_name = video_title or f"Transcript {video_id}"
             file_uri = upload_text_to_gemini_file(
@@ -72,7 +104,7 @@ class UploadTranscriptToGeminiFileTool(BaseTool):
                 "status": "success",
                 "video_id": video_id,
                 "file_uri": file_uri,
-                "usage_instruction": "Pass this file_uri to the analysis_tool.",
+                "usage_instruction": _SINGLE_USAGE_INSTRUCTION,
             }
         except Exception as exc:  # noqa: BLE001
             logger.exception("Failed to upload transcript for %s", video_id)
@@ -82,5 +114,45 @@ class UploadTranscriptToGeminiFileTool(BaseTool):
                 "error": f"Failed to upload transcript: {exc}",
             }
 
-
-__all__ = ["UploadTranscriptToGeminiFileInput", "UploadTranscriptToGeminiFileTool"]
+    def _upload_many(self, transcripts: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Upload several transcripts concurrently; one failure does not fail the rest."""
+        try:
+            items = [TranscriptUploadItem.model_validate(item) for item in transcripts]
+        except ValueError as exc:
+            return {"status": "error", "error": f"Invalid transcripts: {exc}"}
+        outcomes = bulk_upload_texts_to_gemini_files(
+            [
+                (item.transcript_text, item.video_title or f"Transcript {item.video_id}")
+                for item in items
+            ]
+        )
+        files: List[Dict[str, Any]] = []
+        for item, outcome in zip(items, outcomes, strict=True):
+            if isinstance(outcome, Exception):
+                files.append(
+                    {
+                        "video_id": item.video_id,
+                        "error": f"Failed to upload transcript: {outcome}",
+                    }
+                )
+            else:
+                files.append({"video_id": item.video_id, "file_uri": outcome})
+        failed = sum(1 for entry in files if "error" in entry)
+        if not failed:
+            status = "success"
+        elif failed < len(files):
+            status = "partial"
+        else:
+            status = "error"
+        return {
+            "status": status,
+            "files": files,
+            "usage_instruction": _BULK_USAGE_INSTRUCTION,
+        }
+
+
+__all__ = [
+    "TranscriptUploadItem",
+    "UploadTranscriptToGeminiFileInput",
+    "UploadTranscriptToGeminiFileTool",
+]
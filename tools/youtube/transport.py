@@ -0,0 +1,110 @@
+"""HTTP transport used by the YouTube Data API client."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional, Tuple
+
+import httplib2
+import httpx
+from googleapiclient.model import JsonModel
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - declared dependency, tolerate stripped envs
+    orjson = None
+
+from config.settings import (
+    YOUTUBE_HTTP2_ENABLED,
+    YOUTUBE_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+    YOUTUBE_HTTP_MAX_CONNECTIONS,
+    YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    YOUTUBE_HTTP_TIMEOUT_SECONDS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+class HttpxHttp:
+    """
+    Minimal `httplib2.Http` stand-in backed by a pooled `httpx.Client`.
+
+    googleapiclient only calls `request(uri, method, body=..., headers=...)` and
+    expects an `(httplib2.Response, bytes)` tuple back, so this adapter is enough
+    to route discovery-built services over HTTP/2 with keep-alive connections.
+    Unlike `httplib2.Http`, the underlying client is thread-safe, so a single
+    instance can back the shared service across worker threads.
+    """
+
+    def __init__(self, client: httpx.Client) -> None:
+        self._client = client
+
+    def request(
+        self,
+        uri: str,
+        method: str = "GET",
+        body: Optional[Any] = None,
+        headers: Optional[Dict[str, str]] = None,
+        redirections: int = httplib2.DEFAULT_MAX_REDIRECTS,
+        connection_type: Any = None,
+    ) -> Tuple[httplib2.Response, bytes]:
+        try:
+            response = self._client.request(method, uri, content=body, headers=headers)
+        except httpx.TimeoutException as exc:
+            raise TimeoutError(str(exc)) from exc
+        except httpx.TransportError as exc:
+            raise ConnectionError(str(exc)) from exc
+
+        info = dict(response.headers)
+        info["status"] = str(response.status_code)
+        resp = httplib2.Response(info)
+        resp.reason = response.reason_phrase
+        return resp, response.content
+
+    def close(self) -> None:
+        self._client.close()
+
+
+class FastJsonModel(JsonModel):
+    """
+    `JsonModel` that decodes response bodies with orjson when it is installed.
+
+    Search and video detail responses carry tens of KB of nested snippets, so
+    decoding is a visible part of each call. Falls back to the stdlib parser when
+    orjson is unavailable or rejects the payload.
+    """
+
+    def deserialize(self, content):
+        if orjson is None:
+            return super().deserialize(content)
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            return super().deserialize(content)
+        if self._data_wrapper and isinstance(body, dict) and "data" in body:
+            body = body["data"]
+        return body
+
+
+def build_model() -> JsonModel:
+    """Return the response model used for YouTube services."""
+    return FastJsonModel(data_wrapper=False)
+
+
+def build_http() -> HttpxHttp:
+    """Create a pooled HTTP/2 transport for googleapiclient services."""
+    client = httpx.Client(
+        http2=YOUTUBE_HTTP2_ENABLED,
+        timeout=YOUTUBE_HTTP_TIMEOUT_SECONDS,
+        limits=httpx.Limits(
+            max_connections=YOUTUBE_HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=YOUTUBE_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=YOUTUBE_HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+        follow_redirects=True,
+    )
+    logger.debug("Created YouTube HTTP transport (http2=%s)", YOUTUBE_HTTP2_ENABLED)
+    return HttpxHttp(client)
+
+
+__all__ = ["FastJsonModel", "HttpxHttp", "build_http", "build_model"]
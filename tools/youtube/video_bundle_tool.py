@@ -0,0 +1,178 @@
+"""Tool that fetches a video's details and top comments in one round trip."""
+
+from __future__ import annotations
+
+import logging
+from typing import Any, Dict, Optional
+
+from google.adk.tools import BaseTool
+from googleapiclient.errors import HttpError
+from pydantic import BaseModel, Field
+
+from tools.declarations import DeclarationCacheMixin
+from tools.executor import run_blocking_coalesced
+from tools.youtube.circuit import UpstreamUnavailableError
+from tools.youtube.client import (
+    execute_batch,
+    execute_request,
+    get_youtube_service,
+    is_valid_video_id,
+)
+from tools.youtube.comments_tool import cached_comments, comment_threads_request, store_comments
+from tools.youtube.details_tool import (
+    cached_video_items,
+    load_video_items,
+    store_video_response,
+    videos_request,
+)
+from tools.youtube.quota import QuotaExceededError
+from tools.youtube.time_utils import parse_iso8601_duration
+
+logger = logging.getLogger(__name__)
+
+_DEFAULT_BUNDLE_COMMENTS = 20
+
+
+def _comments_error(video_id: str, exc: Exception) -> str:
+    # Comments are often disabled or fail on their own; the video details are still useful.
+    logger.warning("Failed to fetch comments for %s: %s", video_id, exc)
+    if isinstance(exc, QuotaExceededError):
+        return "YouTube quota budget exhausted."
+    if isinstance(exc, UpstreamUnavailableError):
+        return "YouTube API temporarily unavailable."
+    return f"YouTube API error: {exc}"
+
+
+class VideoBundleInput(BaseModel):
+    video_id: str = Field(..., description="The ID of the YouTube video.")
+    max_comments: int = Field(
+        _DEFAULT_BUNDLE_COMMENTS,
+        description="Number of top comments to include (1 to 100, default 20).",
+    )
+
+
+class GetVideoBundleTool(DeclarationCacheMixin, BaseTool):
+    """Tool to get a video's details and top comments together. COST: 2 quota units."""
+
+    NAME = "get_video_bundle"
+    DESCRIPTION = (
+        "Fetches a video's metadata (snippet, statistics, duration) and its top comments "
+        "in a single request. Prefer this over calling get_video_details and "
+        "get_video_comments separately for the same video. "
+        "This call costs approximately 2 quota units."
+    )
+
+    def __init__(self) -> None:
+        super().__init__(
+            name=self.NAME,
+            description=self.DESCRIPTION,
+        )
+
+    @property
+    def args_schema(self) -> type[VideoBundleInput]:
+        return VideoBundleInput
+
+    async def run_async(self, *, args: dict[str, Any], tool_context) -> Dict[str, Any]:
+        return await run_blocking_coalesced(
+            self,
+            video_id=args["video_id"],
+            max_comments=args.get("max_comments", _DEFAULT_BUNDLE_COMMENTS),
+        )
+
+    def __call__(
+        self,
+        video_id: str,
+        max_comments: int = _DEFAULT_BUNDLE_COMMENTS,
+    ) -> Dict[str, Any]:
+        if not is_valid_video_id(video_id):
+            return {"video_id": video_id, "error": "Invalid video ID."}
+        try:
+            max_comments = max(1, min(100, max_comments))
+            video_items = cached_video_items(video_id)
+            comments = cached_comments(video_id, max_comments)
+            comments_error: Optional[str] = None
+
+            if video_items is None and comments is None:
+                service = get_youtube_service()
+                results = execute_batch(
+                    {
+                        "video": videos_request([video_id]),
+                        "comments": comment_threads_request(service, video_id, max_comments),
+                    },
+                    service=service,
+                    label="video bundle",
+                )
+                response, exception = results["video"]
+                if exception is not None:
+                    raise exception
+                video_items = store_video_response(video_id, response)
+                response, exception = results["comments"]
+                if exception is not None:
+                    comments_error = _comments_error(video_id, exception)
+                else:
+                    comments = response.get("items", [])
+                    store_comments(video_id, max_comments, comments)
+            else:
+                if video_items is None:
+                    video_items = load_video_items(video_id)
+                if comments is None:
+                    request = comment_threads_request(
+                        get_youtube_service(), video_id, max_comments
+                    )
+                    try:
+                        response = execute_request(request, retries=2, label="video bundle")
+                    except (HttpError, QuotaExceededError, UpstreamUnavailableError) as exc:
+                        comments_error = _comments_error(video_id, exc)
+                    else:
+                        comments = response.get("items", [])
+                        store_comments(video_id, max_comments, comments)
+
+            if not video_items:
+                return {
+                    "video_id": video_id,
+                    "error": "Video not found.",
+                }
+
+            result: Dict[str, Any] = {
+                "video_id": video_id,
+                "video": video_items[0],
+                "comments": comments or [],
+            }
+            if comments_error:
+                result["comments_error"] = comments_error
+            duration_iso = (video_items[0].get("contentDetails") or {}).get("duration")
+            if duration_iso:
+                try:
+                    result["duration_seconds"] = parse_iso8601_duration(duration_iso)
+                except ValueError:
+                    logger.warning("Failed to parse duration for video %s: %s", video_id, duration_iso)
+            return result
+        except QuotaExceededError as quota_err:
+            return {
+                "video_id": video_id,
+                "error": "YouTube quota budget exhausted.",
+                "retry_after": quota_err.retry_after,
+            }
+        except UpstreamUnavailableError as upstream_err:
+            return {
+                "video_id": video_id,
+                "error": "YouTube API temporarily unavailable.",
+                "retry_after": upstream_err.retry_after,
+            }
+        except HttpError as http_err:
+            logger.warning(
+                "YouTube API error when fetching video bundle for %s: %s", video_id, http_err
+            )
+            return {
+                "video_id": video_id,
+                "error": f"YouTube API error: {http_err}",
+            }
+        except Exception as exc:  # noqa: BLE001
+            logger.exception("Unexpected error when fetching video bundle for %s", video_id)
+            return {
+                "video_id": video_id,
+                "error": f"Unexpected error: {exc}",
+            }
+
+
+__all__ = ["VideoBundleInput", "GetVideoBundleTool"]
@@ -9,6 +9,7 @@ from tools.youtube import (
     ChannelVideoSearchInput,
     GetChannelDetailsTool,
     GetLatestVideosTool,
+    GetVideoBundleTool,
     GetVideoCommentsTool,
     GetVideoDetailsTool,
     EnrichPlaylistVideosInput,
@@ -19,6 +20,7 @@ from tools.youtube import (
     SearchChannelVideosTool,
     UploadTranscriptToGeminiFileInput,
     UploadTranscriptToGeminiFileTool,
+    VideoBundleInput,
     VideoCommentsInput,
     VideoDetailsInput,
     execute_request,
@@ -56,4 +58,6 @@ __all__ = (
     "EnrichPlaylistVideosTool",
     "UploadTranscriptToGeminiFileInput",
     "UploadTranscriptToGeminiFileTool",
+    "VideoBundleInput",
+    "GetVideoBundleTool",
 )